@@ -1,13 +1,28 @@
 #!/usr/bin/env python3
+import functools
 import json
+import shutil
 import subprocess
 import sys
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
+
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+try:  # pragma: no cover - optional dependency
+    import boto3
+except ImportError:  # pragma: no cover - fall back to the AWS CLI
+    boto3 = None
+
+_AWS_CLI = shutil.which("aws") or "aws"
+_NOT_FOUND_MARKER = b"RepositoryNotFoundException"
 
 
 def main() -> None:
     try:
-        query = json.load(sys.stdin)
+        query = _loads(sys.stdin.buffer.read())
     except json.JSONDecodeError as exc:
         raise SystemExit(f"invalid JSON input: {exc}") from exc
 
@@ -17,39 +32,74 @@ def main() -> None:
 
     region = query.get("region")
 
-    args = ["aws", "ecr", "describe-repositories", "--repository-names", repository_name]
-    if region:
-        args.extend(["--region", region])
+    if boto3 is not None:
+        repositories = _describe_with_boto3(repository_name, region)
+    else:
+        repositories = _describe_with_cli(repository_name, region)
 
-    try:
-        output = subprocess.check_output(args, stderr=subprocess.STDOUT)
-    except subprocess.CalledProcessError as exc:
-        message = exc.output.decode("utf-8", errors="ignore")
-        if "RepositoryNotFoundException" in message:
-            json.dump(_to_string_map({"exists": False}), sys.stdout)
-            return
-        sys.stderr.write(message)
-        raise
-
-    description = json.loads(output.decode("utf-8"))
-    repositories = description.get("repositories") or []
     if not repositories:
-        json.dump(_to_string_map({"exists": False}), sys.stdout)
+        _emit({"exists": False})
         return
 
     repository = repositories[0]
-    json.dump(
-        _to_string_map(
-            {
-                "exists": True,
-                "repository_url": repository.get("repositoryUri"),
-                "registry_id": repository.get("registryId"),
-            }
-        ),
-        sys.stdout,
+    _emit(
+        {
+            "exists": True,
+            "repository_url": repository.get("repositoryUri"),
+            "registry_id": repository.get("registryId"),
+        }
     )
 
 
+@functools.lru_cache(maxsize=None)
+def _ecr_client(region: Optional[str]) -> Any:
+    """Return a memoised ECR client so credential resolution happens once."""
+
+    return boto3.client("ecr", region_name=region or None)
+
+
+def _describe_with_boto3(repository_name: str, region: Optional[str]) -> List[Dict[str, Any]]:
+    client = _ecr_client(region)
+    try:
+        description = client.describe_repositories(repositoryNames=[repository_name])
+    except client.exceptions.RepositoryNotFoundException:
+        return []
+    return description.get("repositories") or []
+
+
+def _describe_with_cli(repository_name: str, region: Optional[str]) -> List[Dict[str, Any]]:
+    args = [_AWS_CLI, "ecr", "describe-repositories", "--repository-names", repository_name]
+    if region:
+        args.extend(["--region", region])
+
+    result = subprocess.run(args, capture_output=True, check=False)
+    if result.returncode != 0:
+        if _NOT_FOUND_MARKER in result.stderr or _NOT_FOUND_MARKER in result.stdout:
+            return []
+        sys.stderr.write(result.stderr.decode("utf-8", errors="ignore"))
+        raise SystemExit(result.returncode)
+
+    description = _loads(result.stdout)
+    return description.get("repositories") or []
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _emit(values: Dict[str, Any]) -> None:
+    """Write *values* to stdout as the Terraform external data source result."""
+
+    result = _to_string_map(values)
+    if orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(result))
+    else:
+        json.dump(result, sys.stdout)
+    sys.stdout.flush()
+
+
 def _to_string_map(values: Dict[str, Any]) -> Dict[str, str]:
     """Return a copy of *values* with all entries coerced to strings.
 
@@ -8,6 +8,13 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Mapping
 
+from _fileio import atomic_write
+
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
 
 DEFAULT_SERVER_NAME = "vertica-mcp"
 
@@ -16,13 +23,30 @@ class ClaudeConfigError(Exception):
     """Raised when the Terraform metadata cannot be converted."""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EndpointSelection:
     base_url: str
     sse_url: str | None
     health_url: str | None
 
 
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialise ``value`` as indented, key-sorted JSON terminated by a newline.
+
+    Always uses the stdlib encoder: the file is tiny, and orjson would write
+    non-ASCII characters unescaped, so the output would depend on whether it
+    happens to be installed.
+    """
+
+    return (json.dumps(value, indent=2, sort_keys=True) + "\n").encode("ascii")
+
+
 def _normalise(value: Any) -> str | None:
     if value is None:
         return None
@@ -37,85 +61,84 @@ def _select_endpoints(metadata: Mapping[str, Any]) -> EndpointSelection:
     if not isinstance(endpoints, Mapping):
         endpoints = {}
 
-    https_url = _normalise(endpoints.get("https"))
-    https_sse = _normalise(endpoints.get("https_sse"))
-    https_health = _normalise(endpoints.get("https_healthz"))
-
-    http_url = _normalise(endpoints.get("http"))
-    http_sse = _normalise(endpoints.get("sse"))
-    http_health = _normalise(endpoints.get("healthz"))
+    normalise = _normalise
 
+    https_url = normalise(endpoints.get("https"))
     if https_url:
         return EndpointSelection(
             base_url=https_url,
-            sse_url=https_sse,
-            health_url=https_health,
+            sse_url=normalise(endpoints.get("https_sse")),
+            health_url=normalise(endpoints.get("https_healthz")),
         )
+
+    http_url = normalise(endpoints.get("http"))
     if http_url:
         return EndpointSelection(
             base_url=http_url,
-            sse_url=http_sse,
-            health_url=http_health,
+            sse_url=normalise(endpoints.get("sse")),
+            health_url=normalise(endpoints.get("healthz")),
         )
 
     raise ClaudeConfigError("MCP metadata does not include an HTTP endpoint")
 
 
 def build_transport(metadata: Mapping[str, Any]) -> dict[str, Any]:
-    selection = _select_endpoints(metadata)
+    """Return the Claude transport block with its keys in sorted order."""
 
-    transport: dict[str, Any] = {
-        "type": "http",
-        "url": selection.base_url,
-    }
-    if selection.sse_url:
-        transport["sseUrl"] = selection.sse_url
-    if selection.health_url:
-        transport["healthUrl"] = selection.health_url
+    selection = _select_endpoints(metadata)
 
+    headers: dict[str, str] = {}
+    token: str | None = None
     auth = metadata.get("auth")
     if isinstance(auth, Mapping):
         header = _normalise(auth.get("header"))
         value = _normalise(auth.get("value"))
         token = _normalise(auth.get("token"))
-
-        headers: dict[str, str] = {}
         if header and value:
             headers[header] = value
-        if headers:
-            transport["headers"] = headers
-        if token:
-            transport["token"] = token
 
-    return transport
+    items = (
+        ("headers", headers),
+        ("healthUrl", selection.health_url),
+        ("sseUrl", selection.sse_url),
+        ("token", token),
+        ("type", "http"),
+        ("url", selection.base_url),
+    )
+    return {key: value for key, value in items if value}
+
+
+# Database metadata keys copied into the config, listed in sorted order.
+_DATABASE_KEYS = ("host", "name", "password", "port", "user")
 
 
 def build_claude_config(
     metadata: Mapping[str, Any], *, server_name: str = DEFAULT_SERVER_NAME
 ) -> dict[str, Any]:
+    """Build the Claude Desktop config with every mapping already key-sorted.
+
+    ``_dumps`` relies on this ordering instead of sorting keys while
+    serialising.
+    """
+
     if not server_name or not server_name.strip():
         raise ClaudeConfigError("Server name must be a non-empty string")
 
     transport = build_transport(metadata)
-    config = {
-        "mcpServers": {
-            server_name: {
-                "transport": transport,
-            }
-        }
-    }
+    server: dict[str, Any] = {}
 
     database = metadata.get("database")
     if isinstance(database, Mapping):
-        extras: dict[str, Any] = {}
-        for key in ("host", "port", "name", "user", "password"):
-            value = database.get(key)
-            if value is not None and value != "":
-                extras[key] = value
+        extras = {
+            key: value
+            for key in _DATABASE_KEYS
+            if (value := database.get(key)) is not None and value != ""
+        }
         if extras:
-            config["mcpServers"][server_name]["metadata"] = {"database": extras}
+            server["metadata"] = {"database": extras}
 
-    return config
+    server["transport"] = transport
+    return {"mcpServers": {server_name: server}}
 
 
 def write_claude_config(
@@ -125,14 +148,20 @@ def write_claude_config(
     server_name: str = DEFAULT_SERVER_NAME,
 ) -> Path:
     config = build_claude_config(metadata, server_name=server_name)
+    payload = _dumps(config)
+    try:
+        if output_path.read_bytes() == payload:
+            return output_path
+    except OSError:
+        pass
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(config, indent=2, sort_keys=True) + "\n")
+    atomic_write(output_path, payload)
     return output_path
 
 
 def load_metadata(path: Path) -> Mapping[str, Any]:
     try:
-        raw = json.loads(path.read_text(encoding="utf-8"))
+        raw = _loads(path.read_bytes())
     except json.JSONDecodeError as exc:  # pragma: no cover - defensive guard
         raise ClaudeConfigError(f"Failed to parse MCP metadata: {exc}") from exc
 
@@ -141,7 +170,7 @@ def load_metadata(path: Path) -> Mapping[str, Any]:
     return raw
 
 
-def parse_args() -> argparse.Namespace:
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
         "--a2a",
@@ -160,7 +189,11 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_SERVER_NAME,
         help="Name to use for the Claude MCP server entry",
     )
-    return parser.parse_args()
+    return parser
+
+
+def parse_args() -> argparse.Namespace:
+    return _build_parser().parse_args()
 
 
 def main() -> None:
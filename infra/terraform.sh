@@ -55,11 +55,15 @@ Environment:
   MCP_DB_PASSWORD, and MCP_DB_NAME provide environment overrides for the
   corresponding Terraform variables. TF_VAR_* exports remain fully supported
   and take precedence over the built-in defaults.
+  INFRA_PYTHON selects the interpreter used for the Python helpers in infra/
+  (defaults to python3). The helpers are pure Python with optional
+  accelerators, so pointing this at pypy3 is supported.
 USAGE
 }
 
 SCRIPT_DIR=$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)
 REPO_ROOT=$(cd "${SCRIPT_DIR}/.." && pwd)
+INFRA_PYTHON="${INFRA_PYTHON:-python3}"
 cd "${SCRIPT_DIR}"
 
 log_step() {
@@ -379,7 +383,7 @@ write_a2a_artifact() {
   fi
 
   log_step "Exporting MCP automation artefacts"
-  python - "${tmp_file}" "${A2A_ARTIFACT_PATH}" "${CLAUDE_CONFIG_PATH}" "${SCRIPT_DIR}" <<'PY'
+  "${INFRA_PYTHON}" - "${tmp_file}" "${A2A_ARTIFACT_PATH}" "${CLAUDE_CONFIG_PATH}" "${SCRIPT_DIR}" <<'PY'
 import json
 import pathlib
 import sys
@@ -391,7 +395,7 @@ script_dir = pathlib.Path(sys.argv[4])
 sys.path.insert(0, str(script_dir))
 
 try:
-    outputs = json.loads(outputs_path.read_text())
+    outputs = json.loads(outputs_path.read_bytes())
 except json.JSONDecodeError:
     sys.exit(0)
 
@@ -433,7 +437,7 @@ update_readme_from_outputs() {
   fi
 
   log_step "Refreshing README endpoints from Terraform outputs"
-  if ! python3 "${SCRIPT_DIR}/update_readme.py" --readme "${REPO_ROOT}/README.md" --outputs-json "${tmp_file}"; then
+  if ! "${INFRA_PYTHON}" "${SCRIPT_DIR}/update_readme.py" --readme "${REPO_ROOT}/README.md" --outputs-json "${tmp_file}"; then
     echo "Warning: failed to update README endpoints from Terraform outputs." >&2
   fi
 
@@ -442,7 +446,7 @@ update_readme_from_outputs() {
 
 reset_readme_endpoints() {
   log_step "Resetting README endpoints"
-  if ! python3 "${SCRIPT_DIR}/update_readme.py" --readme "${REPO_ROOT}/README.md"; then
+  if ! "${INFRA_PYTHON}" "${SCRIPT_DIR}/update_readme.py" --readme "${REPO_ROOT}/README.md"; then
     echo "Warning: failed to reset README endpoints." >&2
   fi
 }
@@ -4,13 +4,32 @@
 from __future__ import annotations
 
 import argparse
-import datetime as dt
 import json
+import time
 from pathlib import Path
 from typing import Any, Optional
 
+from _fileio import atomic_write
+
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+try:  # pragma: no cover - optional streaming parser
+    import ijson
+except ImportError:  # pragma: no cover - parse the whole document instead
+    ijson = None
+
+_PARSE_ERRORS: tuple[type[Exception], ...] = (ValueError,)
+if ijson is not None:  # pragma: no cover - depends on the optional parser
+    _PARSE_ERRORS += (ijson.JSONError,)
+
 BEGIN_MARKER = "<!-- BEGIN MCP ENDPOINTS -->"
 END_MARKER = "<!-- END MCP ENDPOINTS -->"
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%SZ"
+_BEGIN = BEGIN_MARKER.encode("ascii")
+_END = END_MARKER.encode("ascii")
 
 
 def format_link(url: Optional[str]) -> str:
@@ -35,33 +54,41 @@ def build_section(
 ) -> str:
     """Render the Markdown snippet that lives between the README markers."""
 
-    lines: list[str] = []
+    link = format_link
+    timestamp = time.strftime(_TIMESTAMP_FORMAT, time.gmtime())
 
-    lines.append("**Direct EC2 (HTTP on port 8000)**  ")
     if http_url:
-        lines.append(f"* Base URL: {format_link(http_url)}")
-        lines.append(f"* Health check: {format_link(health_url)}")
-        lines.append(f"* Server-Sent Events: {format_link(sse_url)}")
-        lines.append(f"* Public IP: `{public_ip.strip() if public_ip else 'n/a'}`")
-        lines.append(f"* Public DNS: `{public_dns.strip() if public_dns else 'n/a'}`")
+        direct = (
+            f"* Base URL: {link(http_url)}\n"
+            f"* Health check: {link(health_url)}\n"
+            f"* Server-Sent Events: {link(sse_url)}\n"
+            f"* Public IP: `{public_ip.strip() if public_ip else 'n/a'}`\n"
+            f"* Public DNS: `{public_dns.strip() if public_dns else 'n/a'}`"
+        )
     else:
-        lines.append("* Not available (deployment not yet provisioned).")
+        direct = "* Not available (deployment not yet provisioned)."
 
-    lines.append("")
-    lines.append("**CloudFront (HTTPS)**  ")
     if https_url:
-        lines.append(f"* Distribution domain: `{cloudfront_domain.strip() if cloudfront_domain else 'n/a'}`")
-        lines.append(f"* Base URL: {format_link(https_url)}")
-        lines.append(f"* Health check: {format_link(https_health_url)}")
-        lines.append(f"* Server-Sent Events: {format_link(https_sse_url)}")
+        cloudfront = (
+            f"* Distribution domain: `{cloudfront_domain.strip() if cloudfront_domain else 'n/a'}`\n"
+            f"* Base URL: {link(https_url)}\n"
+            f"* Health check: {link(https_health_url)}\n"
+            f"* Server-Sent Events: {link(https_sse_url)}"
+        )
     else:
-        lines.append("* Not enabled for this deployment.")
-
-    timestamp = dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%d %H:%M:%SZ")
-    lines.append("")
-    lines.append(f"_Last updated: {timestamp}_")
+        cloudfront = "* Not enabled for this deployment."
 
-    return "\n".join(lines)
+    return "".join(
+        (
+            "**Direct EC2 (HTTP on port 8000)**  \n",
+            direct,
+            "\n\n**CloudFront (HTTPS)**  \n",
+            cloudfront,
+            "\n\n_Last updated: ",
+            timestamp,
+            "_",
+        )
+    )
 
 
 def replace_section(readme_path: Path, new_section: str) -> bool:
@@ -70,27 +97,24 @@ def replace_section(readme_path: Path, new_section: str) -> bool:
     Returns ``True`` when the file was modified.
     """
 
-    contents = readme_path.read_text(encoding="utf-8")
-    try:
-        start = contents.index(BEGIN_MARKER) + len(BEGIN_MARKER)
-        end = contents.index(END_MARKER, start)
-    except ValueError as exc:  # pragma: no cover - guarded by CI
-        raise SystemExit("README markers for MCP endpoints were not found") from exc
+    contents = readme_path.read_bytes()
+    start = contents.find(_BEGIN)
+    end = contents.find(_END, start + len(_BEGIN)) if start != -1 else -1
+    if end == -1:  # pragma: no cover - guarded by CI
+        raise SystemExit("README markers for MCP endpoints were not found")
+    start += len(_BEGIN)
 
-    before = contents[:start]
-    after = contents[end:]
-
-    replacement = f"\n\n{new_section}\n\n"
-    updated = before + replacement + after
-
-    if updated == contents:
+    replacement = b"\n\n" + new_section.encode("utf-8") + b"\n\n"
+    view = memoryview(contents)
+    if view[start:end] == replacement:
         return False
 
-    readme_path.write_text(updated, encoding="utf-8")
+    updated = b"".join((view[:start], replacement, view[end:]))
+    atomic_write(readme_path, updated)
     return True
 
 
-def parse_args() -> argparse.Namespace:
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--readme", default="README.md", type=Path)
     parser.add_argument("--outputs-json", type=Path)
@@ -103,7 +127,11 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--https-health-url")
     parser.add_argument("--https-sse-url")
     parser.add_argument("--cloudfront-domain")
-    return parser.parse_args()
+    return parser
+
+
+def parse_args() -> argparse.Namespace:
+    return _build_parser().parse_args()
 
 
 def _normalise(value: Any) -> Optional[str]:
@@ -115,11 +143,51 @@ def _normalise(value: Any) -> Optional[str]:
     return str(value)
 
 
+# Top-level Terraform outputs consulted when ``mcp_endpoints`` lacks a value.
+_OUTPUT_FALLBACKS = (
+    ("cloudfront_domain", "cloudfront_domain"),
+    ("http_url", "mcp_endpoint"),
+    ("health_url", "mcp_health"),
+    ("sse_url", "mcp_sse"),
+    ("public_ip", "mcp_public_ip"),
+    ("public_dns", "mcp_public_dns"),
+    ("https_url", "mcp_https"),
+    ("https_health_url", "mcp_https_health"),
+    ("https_sse_url", "mcp_https_sse"),
+)
+
+
+_WANTED_OUTPUTS = frozenset(("mcp_endpoints", *(name for _, name in _OUTPUT_FALLBACKS)))
+
+
+def _read_outputs(outputs_path: Path) -> dict[str, Any]:
+    """Return the Terraform outputs this script needs from ``outputs_path``.
+
+    With ijson installed the document is streamed and parsing stops once
+    every wanted output has been seen; otherwise it is parsed in one go.
+    """
+
+    if ijson is None:
+        data = outputs_path.read_bytes()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+
+    wanted: dict[str, Any] = {}
+    with outputs_path.open("rb") as handle:
+        for name, entry in ijson.kvitems(handle, ""):
+            if name in _WANTED_OUTPUTS:
+                wanted[name] = entry
+                if len(wanted) == len(_WANTED_OUTPUTS):
+                    break
+    return wanted
+
+
 def load_values_from_outputs(outputs_path: Path) -> dict[str, Optional[str]]:
     try:
-        raw = json.loads(outputs_path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:  # pragma: no cover - defensive guard
+        raw = _read_outputs(outputs_path)
+    except _PARSE_ERRORS as exc:  # pragma: no cover - defensive guard
         raise SystemExit(f"Failed to parse Terraform outputs from {outputs_path}: {exc}")
+    if not isinstance(raw, dict):  # pragma: no cover - defensive guard
+        raise SystemExit(f"Terraform outputs in {outputs_path} must be a JSON object")
 
     def get_output(name: str) -> Any:
         entry = raw.get(name)
@@ -146,26 +214,9 @@ def load_values_from_outputs(outputs_path: Path) -> dict[str, Optional[str]]:
         "cloudfront_domain": _normalise(cloudfront.get("domain")),
     }
 
-    if values["cloudfront_domain"] is None:
-        values["cloudfront_domain"] = _normalise(get_output("cloudfront_domain"))
-
-    if values["http_url"] is None:
-        values["http_url"] = _normalise(get_output("mcp_endpoint"))
-    if values["health_url"] is None:
-        values["health_url"] = _normalise(get_output("mcp_health"))
-    if values["sse_url"] is None:
-        values["sse_url"] = _normalise(get_output("mcp_sse"))
-    if values["public_ip"] is None:
-        values["public_ip"] = _normalise(get_output("mcp_public_ip"))
-    if values["public_dns"] is None:
-        values["public_dns"] = _normalise(get_output("mcp_public_dns"))
-
-    if values["https_url"] is None:
-        values["https_url"] = _normalise(get_output("mcp_https"))
-    if values["https_health_url"] is None:
-        values["https_health_url"] = _normalise(get_output("mcp_https_health"))
-    if values["https_sse_url"] is None:
-        values["https_sse_url"] = _normalise(get_output("mcp_https_sse"))
+    for key, output_name in _OUTPUT_FALLBACKS:
+        if values[key] is None:
+            values[key] = _normalise(get_output(output_name))
 
     return values
 
@@ -8,12 +8,29 @@ traffic.
 
 from __future__ import annotations
 
-import argparse
+import bisect
+import functools
+import itertools
 import json
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Iterable, List, Optional
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:  # argparse is only imported when the fast path declines
+    import argparse
+
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+try:  # pragma: no cover - optional dependency
+    import boto3
+except ImportError:  # pragma: no cover - fall back to the AWS CLI
+    boto3 = None
 
 
 class ValidationError(Exception):
@@ -42,21 +59,17 @@ def format_range(start: int, end: int) -> str:
 def summarize_security_groups(
     results: Iterable[SecurityGroupCheckResult],
     port: int,
-    return_start: int,
-    return_end: int,
+    port_range: str,
     cidr: str,
 ) -> str:
     lines = [
         "Security group evaluation:",
     ]
-    port_range = format_range(return_start, return_end)
     for result in results:
         inbound = "allows" if result.inbound_allows else "blocks"
         outbound = "allows" if result.outbound_allows else "blocks"
         lines.append(
-            f"  - {result.group_id} {inbound} inbound TCP {port} from {cidr}"
-        )
-        lines.append(
+            f"  - {result.group_id} {inbound} inbound TCP {port} from {cidr}\n"
             f"    and {outbound} outbound TCP {port_range} to {cidr}."
         )
     return "\n".join(lines)
@@ -67,21 +80,19 @@ def summarize_nacls(
     port: int,
     return_start: int,
     return_end: int,
+    port_range: str,
     cidr: str,
 ) -> str:
     lines = [
         "Network ACL evaluation:",
     ]
-    port_range = format_range(return_start, return_end)
     for result in results:
         inbound = "allows" if result.inbound_allows else "blocks"
         outbound_start = "allows" if result.outbound_allows_start else "blocks"
         outbound_end = "allows" if result.outbound_allows_end else "blocks"
         outbound_summary = "allows" if result.outbound_allows_start and result.outbound_allows_end else "blocks"
         lines.append(
-            f"  - {result.nacl_id} {inbound} inbound TCP {port} from {cidr}"
-        )
-        lines.append(
+            f"  - {result.nacl_id} {inbound} inbound TCP {port} from {cidr}\n"
             f"    outbound start/end checks: {outbound_start} {return_start}, {outbound_end} {return_end} (overall {outbound_summary} {port_range})."
         )
     return "\n".join(lines)
@@ -89,24 +100,18 @@ def summarize_nacls(
 
 def describe_network_flow(
     port: int,
-    return_start: int,
-    return_end: int,
+    port_range: str,
     cidr: str,
-    security_groups: Iterable[SecurityGroupCheckResult],
-    nacls: Iterable[NaclCheckResult],
+    sg_ids: str,
+    nacl_ids: str,
 ) -> str:
-    sg_ids = ", ".join(result.group_id for result in security_groups) or "none"
-    nacl_ids = ", ".join(result.nacl_id for result in nacls) or "none"
-    port_range = format_range(return_start, return_end)
-    return "\n".join(
-        [
-            "Deployment network flow:",
-            f"  • Client traffic targets TCP {port} on the EC2 host.",
-            f"  • Security group(s) [{sg_ids}] gate this traffic before it reaches the subnet.",
-            f"  • Subnet network ACL(s) [{nacl_ids}] must also allow the request and subsequent return traffic {port_range}.",
-            f"  • The systemd service maps host port {port} to the Docker container, so permitted packets are delivered directly to the MCP server.",
-            f"  • Responses travel back through the Docker port, the security group egress rules, and the subnet ACL rules to {cidr}.",
-        ]
+    return (
+        "Deployment network flow:\n"
+        f"  • Client traffic targets TCP {port} on the EC2 host.\n"
+        f"  • Security group(s) [{sg_ids or 'none'}] gate this traffic before it reaches the subnet.\n"
+        f"  • Subnet network ACL(s) [{nacl_ids or 'none'}] must also allow the request and subsequent return traffic {port_range}.\n"
+        f"  • The systemd service maps host port {port} to the Docker container, so permitted packets are delivered directly to the MCP server.\n"
+        f"  • Responses travel back through the Docker port, the security group egress rules, and the subnet ACL rules to {cidr}."
     )
 
 
@@ -114,33 +119,80 @@ def run_aws_command(args: List[str]) -> dict:
     """Run an AWS CLI command and parse its JSON output."""
 
     cmd = ["aws", *args, "--output", "json"]
-    try:
-        result = subprocess.run(
-            cmd,
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-    except subprocess.CalledProcessError as exc:  # pragma: no cover - surface in CI
-        stderr = exc.stderr.strip()
+    # Keep stdout as bytes: both parsers accept them directly, which avoids
+    # decoding potentially large describe-* payloads into an interim str.
+    result = subprocess.run(cmd, capture_output=True, check=False)
+    if result.returncode != 0:  # pragma: no cover - surface in CI
+        stderr = result.stderr.decode(errors="replace").strip()
         print(f"AWS CLI command failed: {' '.join(cmd)}", file=sys.stderr)
         if stderr:
             print(stderr, file=sys.stderr)
-        raise
+        raise subprocess.CalledProcessError(
+            result.returncode, cmd, output=result.stdout, stderr=result.stderr
+        )
 
     stdout = result.stdout.strip()
     if not stdout:
         return {}
-    return json.loads(stdout)
+    return _loads(stdout)
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=None)
+def _ec2_client() -> Any:
+    """Return a memoised EC2 client so credentials are resolved once."""
+
+    return boto3.client("ec2")
+
+
+def describe_instance(instance_id: str) -> dict:
+    if boto3 is not None:
+        data = _ec2_client().describe_instances(InstanceIds=[instance_id])
+    else:
+        data = run_aws_command([
+            "ec2",
+            "describe-instances",
+            "--instance-ids",
+            instance_id,
+        ])
+    return data
+
+
+def describe_security_groups(group_ids: List[str]) -> List[dict]:
+    if boto3 is not None:
+        data = _ec2_client().describe_security_groups(GroupIds=group_ids)
+    else:
+        data = run_aws_command([
+            "ec2",
+            "describe-security-groups",
+            "--group-ids",
+            *group_ids,
+        ])
+    return data.get("SecurityGroups", [])
+
+
+def describe_network_acls(subnet_id: str) -> List[dict]:
+    if boto3 is not None:
+        data = _ec2_client().describe_network_acls(
+            Filters=[{"Name": "association.subnet-id", "Values": [subnet_id]}]
+        )
+    else:
+        data = run_aws_command([
+            "ec2",
+            "describe-network-acls",
+            "--filters",
+            f"Name=association.subnet-id,Values={subnet_id}",
+        ])
+    return data.get("NetworkAcls", [])
 
 
 def extract_instance(instance_id: str) -> dict:
-    data = run_aws_command([
-        "ec2",
-        "describe-instances",
-        "--instance-ids",
-        instance_id,
-    ])
+    data = describe_instance(instance_id)
 
     reservations = data.get("Reservations", [])
     for reservation in reservations:
@@ -150,64 +202,73 @@ def extract_instance(instance_id: str) -> dict:
     raise ValidationError(f"Instance {instance_id} not found in describe-instances response")
 
 
-def security_group_allows_port(permissions: Iterable[dict], port: int, cidr: str) -> bool:
-    for permission in permissions:
-        protocol = permission.get("IpProtocol")
-        ip_ranges = permission.get("IpRanges", [])
-        if not any(r.get("CidrIp") == cidr for r in ip_ranges):
-            continue
+# Port span granted by an "all traffic" (protocol -1) rule.
+_ALL_PORTS = (0, 65535)
 
-        if protocol == "-1":
-            return True
-        if protocol != "tcp":
-            continue
 
-        from_port = permission.get("FromPort")
-        to_port = permission.get("ToPort")
-        if from_port is None or to_port is None:
-            continue
-        if from_port <= port <= to_port:
-            return True
-    return False
+@dataclass(frozen=True)
+class PortIndex:
+    """Port spans allowed for one CIDR, sorted by their first port.
+
+    ``reach[i]`` is the highest end port among the first ``i + 1`` spans, so
+    a single bisect answers whether any span covers a requested range.
+    """
+
+    starts: List[int]
+    reach: List[int]
+
+    def covers(self, start_port: int, end_port: int) -> bool:
+        position = bisect.bisect_right(self.starts, start_port)
+        return position > 0 and self.reach[position - 1] >= end_port
+
 
+def index_permissions(permissions: Iterable[dict]) -> Dict[str, PortIndex]:
+    """Group TCP-relevant security group permissions by CIDR in one pass."""
 
-def security_group_allows_range(permissions: Iterable[dict], start_port: int, end_port: int, cidr: str) -> bool:
+    spans: Dict[str, List[Tuple[int, int]]] = {}
     for permission in permissions:
         protocol = permission.get("IpProtocol")
-        ip_ranges = permission.get("IpRanges", [])
-        if not any(r.get("CidrIp") == cidr for r in ip_ranges):
-            continue
-
         if protocol == "-1":
-            return True
-        if protocol != "tcp":
+            span = _ALL_PORTS
+        elif protocol == "tcp":
+            from_port = permission.get("FromPort")
+            to_port = permission.get("ToPort")
+            if from_port is None or to_port is None:
+                continue
+            span = (from_port, to_port)
+        else:
             continue
 
-        from_port = permission.get("FromPort")
-        to_port = permission.get("ToPort")
-        if from_port is None or to_port is None:
-            continue
-        if from_port <= start_port and to_port >= end_port:
-            return True
-    return False
+        for ip_range in permission.get("IpRanges", []):
+            cidr = ip_range.get("CidrIp")
+            if cidr is not None:
+                spans.setdefault(cidr, []).append(span)
 
+    index: Dict[str, PortIndex] = {}
+    for cidr, cidr_spans in spans.items():
+        cidr_spans.sort()
+        reach = list(itertools.accumulate((end for _, end in cidr_spans), max))
+        index[cidr] = PortIndex([start for start, _ in cidr_spans], reach)
+    return index
 
-def evaluate_security_groups(group_ids: List[str], port: int, return_start: int, return_end: int, cidr: str) -> List[SecurityGroupCheckResult]:
-    if not group_ids:
-        raise ValidationError("Instance has no associated security groups")
 
-    data = run_aws_command([
-        "ec2",
-        "describe-security-groups",
-        "--group-ids",
-        *group_ids,
-    ])
+def security_group_allows_port(index: Dict[str, PortIndex], port: int, cidr: str) -> bool:
+    return security_group_allows_range(index, port, port, cidr)
+
+
+def security_group_allows_range(index: Dict[str, PortIndex], start_port: int, end_port: int, cidr: str) -> bool:
+    port_index = index.get(cidr)
+    return port_index is not None and port_index.covers(start_port, end_port)
+
 
+def evaluate_security_groups(security_groups: Iterable[dict], port: int, return_start: int, return_end: int, cidr: str) -> List[SecurityGroupCheckResult]:
     results: List[SecurityGroupCheckResult] = []
-    for sg in data.get("SecurityGroups", []):
+    for sg in security_groups:
         group_id = sg.get("GroupId", "unknown")
-        inbound_ok = security_group_allows_port(sg.get("IpPermissions", []), port, cidr)
-        outbound_ok = security_group_allows_range(sg.get("IpPermissionsEgress", []), return_start, return_end, cidr)
+        inbound_ok = security_group_allows_port(index_permissions(sg.get("IpPermissions", [])), port, cidr)
+        outbound_ok = security_group_allows_range(
+            index_permissions(sg.get("IpPermissionsEgress", [])), return_start, return_end, cidr
+        )
         results.append(SecurityGroupCheckResult(group_id, inbound_ok, outbound_ok))
     return results
 
@@ -231,36 +292,43 @@ def nacl_entry_matches(entry: dict, port: int, cidr: str) -> bool:
     return start <= port <= end
 
 
-def nacl_allows_port(entries: Iterable[dict], port: int, cidr: str, egress: bool) -> bool:
-    relevant = sorted(
-        (entry for entry in entries if entry.get("Egress") is bool(egress)),
-        key=lambda entry: entry.get("RuleNumber", 0),
-    )
-    for entry in relevant:
+def sort_nacl_entries(entries: Iterable[dict]) -> Tuple[List[dict], List[dict]]:
+    """Split NACL entries into (ingress, egress) lists in rule evaluation order."""
+
+    ingress: List[dict] = []
+    egress: List[dict] = []
+    for entry in entries:
+        direction = entry.get("Egress")
+        if direction is False:
+            ingress.append(entry)
+        elif direction is True:
+            egress.append(entry)
+
+    def rule_number(entry: dict) -> int:
+        return entry.get("RuleNumber", 0)
+
+    ingress.sort(key=rule_number)
+    egress.sort(key=rule_number)
+    return ingress, egress
+
+
+def nacl_allows_port(sorted_entries: Iterable[dict], port: int, cidr: str) -> bool:
+    """Return the action of the first matching rule in *sorted_entries*."""
+
+    for entry in sorted_entries:
         if not nacl_entry_matches(entry, port, cidr):
             continue
         return entry.get("RuleAction", "").lower() == "allow"
     return False
 
 
-def evaluate_nacls(subnet_id: str, port: int, return_start: int, return_end: int, cidr: str) -> List[NaclCheckResult]:
-    data = run_aws_command([
-        "ec2",
-        "describe-network-acls",
-        "--filters",
-        f"Name=association.subnet-id,Values={subnet_id}",
-    ])
-
-    nacls = data.get("NetworkAcls", [])
-    if not nacls:
-        raise ValidationError(f"No network ACLs associated with subnet {subnet_id}")
-
+def evaluate_nacls(nacls: Iterable[dict], port: int, return_start: int, return_end: int, cidr: str) -> List[NaclCheckResult]:
     results: List[NaclCheckResult] = []
     for nacl in nacls:
-        entries = nacl.get("Entries", [])
-        inbound_ok = nacl_allows_port(entries, port, cidr, egress=False)
-        outbound_start_ok = nacl_allows_port(entries, return_start, cidr, egress=True)
-        outbound_end_ok = nacl_allows_port(entries, return_end, cidr, egress=True)
+        ingress, egress = sort_nacl_entries(nacl.get("Entries", []))
+        inbound_ok = nacl_allows_port(ingress, port, cidr)
+        outbound_start_ok = nacl_allows_port(egress, return_start, cidr)
+        outbound_end_ok = nacl_allows_port(egress, return_end, cidr)
         results.append(
             NaclCheckResult(
                 nacl_id=nacl.get("NetworkAclId", "unknown"),
@@ -272,29 +340,95 @@ def evaluate_nacls(subnet_id: str, port: int, return_start: int, return_end: int
     return results
 
 
-def main(argv: Optional[List[str]] = None) -> int:
+_DEFAULTS: Dict[str, Any] = {
+    "instance_id": None,
+    "port": 8000,
+    "return_port_start": 1024,
+    "return_port_end": 65535,
+    "cidr": "0.0.0.0/0",
+}
+
+# Option name -> (attribute, converter) for the argparse-free fast path.
+_OPTIONS: Dict[str, Tuple[str, Any]] = {
+    "--instance-id": ("instance_id", str),
+    "--port": ("port", int),
+    "--return-port-start": ("return_port_start", int),
+    "--return-port-end": ("return_port_end", int),
+    "--cidr": ("cidr", str),
+}
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    import argparse
+
     parser = argparse.ArgumentParser(description="Validate MCP network access policies")
     parser.add_argument("--instance-id", required=True, help="ID of the MCP EC2 instance")
-    parser.add_argument("--port", type=int, default=8000, help="Application listening port to validate")
+    parser.add_argument("--port", type=int, default=_DEFAULTS["port"], help="Application listening port to validate")
     parser.add_argument(
         "--return-port-start",
         type=int,
-        default=1024,
+        default=_DEFAULTS["return_port_start"],
         help="Beginning of the return traffic port range",
     )
     parser.add_argument(
         "--return-port-end",
         type=int,
-        default=65535,
+        default=_DEFAULTS["return_port_end"],
         help="End of the return traffic port range",
     )
     parser.add_argument(
         "--cidr",
-        default="0.0.0.0/0",
+        default=_DEFAULTS["cidr"],
         help="CIDR block that must be allowed",
     )
+    return parser
+
+
+def _parse_fast(argv: List[str]) -> Optional[SimpleNamespace]:
+    """Parse the common well-formed command line without argparse.
+
+    Returns ``None`` for anything unusual (``--help``, unknown or abbreviated
+    options, missing or invalid values) so the caller can defer to argparse
+    for its usual help and error output.
+    """
+
+    values = dict(_DEFAULTS)
+    position = 0
+    while position < len(argv):
+        option, sep, value = argv[position].partition("=")
+        spec = _OPTIONS.get(option)
+        if spec is None:
+            return None
+        if not sep:
+            position += 1
+            if position == len(argv):
+                return None
+            value = argv[position]
+            if value.startswith("-"):
+                return None
+        attribute, convert = spec
+        try:
+            values[attribute] = convert(value)
+        except ValueError:
+            return None
+        position += 1
+
+    if values["instance_id"] is None:
+        return None
+    return SimpleNamespace(**values)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> Any:
+    if argv is None:
+        argv = sys.argv[1:]
+    args = _parse_fast(argv)
+    if args is None:
+        args = _build_parser().parse_args(argv)
+    return args
+
 
-    args = parser.parse_args(argv)
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
 
     if args.return_port_start > args.return_port_end:
         raise ValidationError("Return port start must be less than or equal to return port end")
@@ -305,40 +439,55 @@ def main(argv: Optional[List[str]] = None) -> int:
     if not subnet_id:
         raise ValidationError(f"Instance {args.instance_id} does not have an associated subnet")
 
-    sg_results = evaluate_security_groups(group_ids, args.port, args.return_port_start, args.return_port_end, args.cidr)
-    nacl_results = evaluate_nacls(subnet_id, args.port, args.return_port_start, args.return_port_end, args.cidr)
+    if not group_ids:
+        raise ValidationError("Instance has no associated security groups")
+
+    # The security group and network ACL lookups are independent, so issue
+    # them concurrently instead of paying for two sequential round-trips.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        security_groups_future = executor.submit(describe_security_groups, group_ids)
+        nacls_future = executor.submit(describe_network_acls, subnet_id)
+        security_groups = security_groups_future.result()
+        nacls = nacls_future.result()
+
+    if not nacls:
+        raise ValidationError(f"No network ACLs associated with subnet {subnet_id}")
+
+    sg_results = evaluate_security_groups(security_groups, args.port, args.return_port_start, args.return_port_end, args.cidr)
+    nacl_results = evaluate_nacls(nacls, args.port, args.return_port_start, args.return_port_end, args.cidr)
 
     errors: List[str] = []
 
-    print(summarize_security_groups(sg_results, args.port, args.return_port_start, args.return_port_end, args.cidr))
+    # The reporting below reuses these strings several times over.
+    port_range = format_range(args.return_port_start, args.return_port_end)
+    sg_ids = ", ".join(result.group_id for result in sg_results)
+    nacl_ids = ", ".join(result.nacl_id for result in nacl_results)
+
+    print(summarize_security_groups(sg_results, args.port, port_range, args.cidr))
     print()
-    print(summarize_nacls(nacl_results, args.port, args.return_port_start, args.return_port_end, args.cidr))
+    print(summarize_nacls(nacl_results, args.port, args.return_port_start, args.return_port_end, port_range, args.cidr))
     print()
-    print(describe_network_flow(args.port, args.return_port_start, args.return_port_end, args.cidr, sg_results, nacl_results))
+    print(describe_network_flow(args.port, port_range, args.cidr, sg_ids, nacl_ids))
     print()
 
     if not any(result.inbound_allows for result in sg_results):
-        ids = ", ".join(result.group_id for result in sg_results)
         errors.append(
-            f"Security groups [{ids}] do not allow inbound TCP {args.port} from {args.cidr}."
+            f"Security groups [{sg_ids}] do not allow inbound TCP {args.port} from {args.cidr}."
         )
 
     if not any(result.outbound_allows for result in sg_results):
-        ids = ", ".join(result.group_id for result in sg_results)
         errors.append(
-            f"Security groups [{ids}] do not allow outbound TCP {args.return_port_start}-{args.return_port_end} to {args.cidr}."
+            f"Security groups [{sg_ids}] do not allow outbound TCP {args.return_port_start}-{args.return_port_end} to {args.cidr}."
         )
 
     if not any(result.inbound_allows for result in nacl_results):
-        ids = ", ".join(result.nacl_id for result in nacl_results)
         errors.append(
-            f"Network ACLs [{ids}] do not allow inbound TCP {args.port} from {args.cidr}."
+            f"Network ACLs [{nacl_ids}] do not allow inbound TCP {args.port} from {args.cidr}."
         )
 
     if not any(result.outbound_allows_start and result.outbound_allows_end for result in nacl_results):
-        ids = ", ".join(result.nacl_id for result in nacl_results)
         errors.append(
-            f"Network ACLs [{ids}] do not allow outbound return traffic (ports {args.return_port_start}-{args.return_port_end}) to {args.cidr}."
+            f"Network ACLs [{nacl_ids}] do not allow outbound return traffic (ports {args.return_port_start}-{args.return_port_end}) to {args.cidr}."
         )
 
     if errors:
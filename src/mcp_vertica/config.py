@@ -7,19 +7,23 @@ through this module to avoid duplicated parsing logic.
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
-from typing import Any, Iterable
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from typing import Any, Iterable, Iterator, Mapping
 
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
-    ValidationError,
     ValidationInfo,
     field_validator,
 )
-from pydantic.fields import PrivateAttr
 
 from .env import ensure_dotenv
 
@@ -27,13 +31,6 @@ from .env import ensure_dotenv
 LOGGER = logging.getLogger(__name__)
 
 
-# Load the shared .env file before reading configuration so we never fall back
-# to placeholder defaults when the project-wide environment definition is
-# missing.  ``ensure_dotenv`` will abort early with a clear error message if the
-# file cannot be located or parsed.
-ensure_dotenv()
-
-
 # Defaults mirror the Terraform variables defined in ``infra/variables.tf`` so a
 # freshly provisioned environment can still bring the service online even if
 # the operator forgets to override the database settings.  The service will run
@@ -50,6 +47,39 @@ DEFAULT_DB_USER = "mcp_app"
 DEFAULT_DB_PASSWORD = "change-me-please"
 DEFAULT_DB_NAME = "vertica"
 
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+_FALSY = frozenset({"0", "false", "no", "off"})
+_TLS_MODES = frozenset(
+    {"disable", "allow", "prefer", "require", "verify-ca", "verify-full"}
+)
+
+# One ``host[:port]`` entry of ``DB_BACKUP_NODES``; the port is split off at
+# the last colon and surrounding whitespace is dropped.
+_BACKUP_NODE_RE = re.compile(
+    r"\s*(?P<host>[^,]*?)\s*(?::\s*(?P<port>[^,:]*?)\s*)?(?:,|$)"
+)
+
+
+# Copy of ``os.environ`` taken while a ``Settings`` instance is being built so
+# every field resolves against the same plain dict instead of the
+# ``os.environ`` mapping (which re-encodes keys on each lookup).
+_ENV_SNAPSHOT: ContextVar[Mapping[str, str] | None] = ContextVar(
+    "_ENV_SNAPSHOT", default=None
+)
+
+
+# ``MCP_``-prefixed fallback names, built once per key instead of per lookup.
+_PREFIXED_KEYS: dict[str, str] = {}
+
+
+@contextmanager
+def _environment_snapshot() -> Iterator[None]:
+    token = _ENV_SNAPSHOT.set(dict(os.environ))
+    try:
+        yield
+    finally:
+        _ENV_SNAPSHOT.reset(token)
+
 
 def _env(key: str, default: str | None = None) -> str | None:
     """Read environment variables with an ``MCP_`` prefix fallback.
@@ -59,9 +89,16 @@ def _env(key: str, default: str | None = None) -> str | None:
     configuration values.
     """
 
-    value = os.getenv(key)
+    environ = _ENV_SNAPSHOT.get()
+    if environ is None:
+        environ = os.environ
+
+    value = environ.get(key)
     if value is None:
-        value = os.getenv(f"MCP_{key}")
+        prefixed = _PREFIXED_KEYS.get(key)
+        if prefixed is None:
+            prefixed = _PREFIXED_KEYS[key] = f"MCP_{key}"
+        value = environ.get(prefixed)
 
     if value is None:
         return default
@@ -138,9 +175,9 @@ def _env_bool(key: str, default: bool = False) -> bool:
         return default
 
     candidate = value.strip().lower()
-    if candidate in {"1", "true", "yes", "on"}:
+    if candidate in _TRUTHY:
         return True
-    if candidate in {"0", "false", "no", "off"}:
+    if candidate in _FALSY:
         return False
 
     _log_default(key, str(default), f"invalid boolean value {value!r}")
@@ -150,50 +187,47 @@ def _env_bool(key: str, default: bool = False) -> bool:
 def _split_csv(value: str | None, fallback: Iterable[str]) -> list[str]:
     if not value:
         return list(fallback)
-    return [item.strip() for item in value.split(",") if item.strip()]
+    return [token for item in value.split(",") if (token := item.strip())]
 
 
 def _parse_backup_nodes(raw: str | None) -> list[tuple[str, int]]:
-    """Return backup Vertica hosts parsed from ``DB_BACKUP_NODES``."""
+    """Return backup Vertica hosts parsed from ``DB_BACKUP_NODES``.
+
+    Every malformed entry is reported in a single :class:`ValueError` rather
+    than stopping at the first one.
+    """
 
     if not raw:
         return []
 
     nodes: list[tuple[str, int]] = []
-    for entry in raw.split(","):
-        candidate = entry.strip()
-        if not candidate:
+    problems: list[str] = []
+    for match in _BACKUP_NODE_RE.finditer(raw):
+        host, port_text = match.group("host", "port")
+        if port_text is None:
+            if host:
+                nodes.append((host, DEFAULT_DB_PORT))
             continue
 
-        if ":" in candidate:
-            host_part, port_part = candidate.rsplit(":", 1)
-            host = host_part.strip()
-            port_text = port_part.strip()
-            if not host:
-                raise ValueError(
-                    "DB_BACKUP_NODES entries must include a hostname before the colon"
-                )
-            if not port_text:
-                raise ValueError(
-                    "DB_BACKUP_NODES entries must include a port number after the colon"
-                )
-            try:
-                port = int(port_text)
-            except ValueError as exc:  # pragma: no cover - defensive parsing
-                raise ValueError(
-                    "DB_BACKUP_NODES port values must be integers"
-                ) from exc
-        else:
-            host = candidate
-            port = DEFAULT_DB_PORT
-
+        entry = f"{host}:{port_text}"
         if not host:
-            raise ValueError("DB_BACKUP_NODES entries must not be empty")
-
+            problems.append(f"{entry!r} is missing a hostname before the colon")
+            continue
+        if not port_text:
+            problems.append(f"{entry!r} is missing a port number after the colon")
+            continue
+        try:
+            port = int(port_text)
+        except ValueError:
+            problems.append(f"{entry!r} has a non-integer port")
+            continue
         if not 1 <= port <= 65535:
-            raise ValueError("DB_BACKUP_NODES ports must be between 1 and 65535")
+            problems.append(f"{entry!r} has a port outside 1-65535")
+        else:
+            nodes.append((host, port))
 
-        nodes.append((host, port))
+    if problems:
+        raise ValueError("DB_BACKUP_NODES has invalid entries: " + "; ".join(problems))
 
     return nodes
 
@@ -201,7 +235,9 @@ def _parse_backup_nodes(raw: str | None) -> list[tuple[str, int]]:
 class DatabaseOverrides(BaseModel):
     """Runtime database configuration supplied via the API."""
 
-    model_config = ConfigDict(extra="forbid")
+    # Only validated when an operator posts new credentials, so there is no
+    # reason to build the validator at import time.
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     host: str
     port: int = Field(ge=1, le=65535)
@@ -221,190 +257,194 @@ class DatabaseOverrides(BaseModel):
         return candidate
 
 
-class Settings(BaseModel):
-    model_config = ConfigDict(extra="ignore", validate_default=True)
+class SettingsError(ValueError):
+    """Raised when the environment yields an invalid service configuration."""
 
-    _database_source: str = PrivateAttr(default="environment")
 
-    host: str = Field(
-        default_factory=lambda: _env_or_default("DB_HOST", DEFAULT_DB_HOST)
-    )
-    port: int = Field(
-        default_factory=lambda: _env_int_or_default("DB_PORT", DEFAULT_DB_PORT)
-    )
-    user: str = Field(
-        default_factory=lambda: _env_or_default("DB_USER", DEFAULT_DB_USER)
-    )
-    password: str = Field(
-        default_factory=lambda: _env_or_default("DB_PASSWORD", DEFAULT_DB_PASSWORD)
-    )
-    database: str = Field(
-        default_factory=lambda: _env_or_default("DB_NAME", DEFAULT_DB_NAME)
-    )
+def _validate_tls_mode(value: Any) -> str | None:
+    if value is None:
+        return None
 
-    max_rows: int = Field(
-        default_factory=lambda: _env_int_or_default("MAX_ROWS", 1000, warn_missing=False)
-    )
-    query_timeout_s: int = Field(
-        default_factory=lambda: _env_int_or_default(
-            "QUERY_TIMEOUT_S", 15, warn_missing=False
+    candidate = str(value).strip().lower()
+    if not candidate:
+        return None
+
+    if candidate not in _TLS_MODES:
+        raise SettingsError(
+            "DB_TLSMODE must be one of disable, allow, prefer, require, verify-ca, verify-full"
         )
-    )
-    pool_size: int = Field(
-        default_factory=lambda: _env_int_or_default("POOL_SIZE", 8, warn_missing=False)
-    )
+    return candidate
 
-    connection_attempts: int = Field(
-        default_factory=lambda: _env_int_or_default(
-            "DB_CONNECTION_RETRIES", 3, warn_missing=False
-        ),
-        ge=1,
-    )
-    connection_retry_backoff_s: float = Field(
-        default_factory=lambda: _env_float_or_default(
-            "DB_CONNECTION_RETRY_BACKOFF_S", 0.5, warn_missing=False
+
+def _validate_use_ssl(value: Any) -> bool | None:
+    if value is None or isinstance(value, bool):
+        return value
+
+    candidate = str(value).strip().lower()
+    if not candidate:
+        return None
+
+    if candidate in _TRUTHY:
+        return True
+    if candidate in _FALSY:
+        return False
+
+    raise SettingsError("DB_USE_SSL must be a boolean value")
+
+
+def _validate_optional_path(value: Any) -> str | None:
+    if value is None:
+        return None
+
+    candidate = str(value).strip()
+    if not candidate:
+        return None
+    return candidate
+
+
+def _validate_backup_nodes(raw: str | None) -> list[tuple[str, int]]:
+    try:
+        return _parse_backup_nodes(raw)
+    except ValueError as exc:
+        raise SettingsError(str(exc)) from exc
+
+
+# Settings fields mapped to the lazily built value that is derived from them.
+_DERIVED_CACHES: dict[str, str] = {
+    "allowed_schemas": "_allowed_schema_set",
+    **dict.fromkeys(
+        (
+            "host",
+            "port",
+            "user",
+            "password",
+            "database",
+            "backup_nodes",
+            "tls_mode",
+            "use_ssl",
+            "tls_cafile",
+            "tls_certfile",
+            "tls_keyfile",
         ),
-        ge=0,
-    )
+        "_connection_options",
+    ),
+}
 
-    http_token: str | None = Field(default_factory=lambda: _env("HTTP_TOKEN"))
-    cors_origins: str | None = Field(default_factory=lambda: _env("CORS_ORIGINS"))
 
-    allowed_schemas: list[str] = Field(
-        default_factory=lambda: _split_csv(_env("ALLOWED_SCHEMAS"), ["public"])
-    )
+@dataclass(slots=True, init=False)
+class Settings:
+    """Service configuration resolved from the environment in a single pass.
 
-    db_debug_logging: bool = Field(
-        default_factory=lambda: _env_bool("DB_DEBUG", default=False)
-    )
+    Construction reads every setting from one snapshot of ``os.environ`` and
+    validates the result; invalid values raise :class:`SettingsError`.
+    """
 
-    backup_nodes: list[tuple[str, int]] = Field(
-        default_factory=lambda: _parse_backup_nodes(_env("DB_BACKUP_NODES"))
-    )
+    host: str
+    port: int
+    user: str
+    password: str
+    database: str
 
-    tls_mode: str | None = Field(
-        default_factory=lambda: _env("DB_TLSMODE")
-    )
-    use_ssl: bool | None = Field(
-        default_factory=lambda: _env("DB_USE_SSL")
-    )
-    tls_cafile: str | None = Field(default_factory=lambda: _env("DB_TLS_CAFILE"))
-    tls_certfile: str | None = Field(
-        default_factory=lambda: _env("DB_TLS_CERTFILE")
-    )
-    tls_keyfile: str | None = Field(default_factory=lambda: _env("DB_TLS_KEYFILE"))
+    max_rows: int
+    query_timeout_s: int
+    pool_size: int
+    pool_idle_timeout_s: float
 
-    def model_post_init(self, __context: Any) -> None:  # pragma: no cover - simple assignment
-        self._database_source = "environment"
+    connection_attempts: int
+    connection_retry_backoff_s: float
+    connection_retry_max_s: float
 
-    @field_validator("allowed_schemas")
-    @classmethod
-    def _validate_schemas(cls, value: list[str]) -> list[str]:
-        if not value:
-            raise ValueError("At least one allowed schema must be configured")
-        return value
+    http_token: str | None
+    cors_origins: str | None
 
-    @field_validator("tls_mode", mode="before")
-    @classmethod
-    def _validate_tls_mode(cls, value: Any) -> str | None:
-        if value is None:
-            return None
+    allowed_schemas: list[str]
 
-        candidate = str(value).strip().lower()
-        if not candidate:
-            return None
-
-        allowed = {
-            "disable",
-            "allow",
-            "prefer",
-            "require",
-            "verify-ca",
-            "verify-full",
-        }
-        if candidate not in allowed:
-            raise ValueError(
-                "DB_TLSMODE must be one of disable, allow, prefer, require, verify-ca, verify-full"
+    db_debug_logging: bool
+
+    backup_nodes: list[tuple[str, int]]
+
+    tls_mode: str | None
+    use_ssl: bool | None
+    tls_cafile: str | None
+    tls_certfile: str | None
+    tls_keyfile: str | None
+
+    _database_source: str = field(repr=False, compare=False)
+    _allowed_schema_set: frozenset[str] | None = field(repr=False, compare=False)
+    _connection_options: Mapping[str, Any] | None = field(repr=False, compare=False)
+
+    def __init__(self) -> None:
+        with _environment_snapshot():
+            self.host = _env_or_default("DB_HOST", DEFAULT_DB_HOST)
+            self.port = _env_int_or_default("DB_PORT", DEFAULT_DB_PORT)
+            self.user = _env_or_default("DB_USER", DEFAULT_DB_USER)
+            self.password = _env_or_default("DB_PASSWORD", DEFAULT_DB_PASSWORD)
+            self.database = _env_or_default("DB_NAME", DEFAULT_DB_NAME)
+
+            self.max_rows = _env_int_or_default("MAX_ROWS", 1000, warn_missing=False)
+            self.query_timeout_s = _env_int_or_default(
+                "QUERY_TIMEOUT_S", 15, warn_missing=False
+            )
+            self.pool_size = _env_int_or_default("POOL_SIZE", 8, warn_missing=False)
+            self.pool_idle_timeout_s = _env_float_or_default(
+                "POOL_IDLE_TIMEOUT_S", 300.0, warn_missing=False
             )
-        return candidate
 
-    @field_validator("use_ssl", mode="before")
-    @classmethod
-    def _validate_use_ssl(cls, value: Any) -> bool | None:
-        if value is None or isinstance(value, bool):
-            return value
+            self.connection_attempts = _env_int_or_default(
+                "DB_CONNECTION_RETRIES", 3, warn_missing=False
+            )
+            self.connection_retry_backoff_s = _env_float_or_default(
+                "DB_CONNECTION_RETRY_BACKOFF_S", 0.5, warn_missing=False
+            )
+            self.connection_retry_max_s = _env_float_or_default(
+                "DB_CONNECTION_RETRY_MAX_S", 30.0, warn_missing=False
+            )
 
-        candidate = str(value).strip().lower()
-        if not candidate:
-            return None
+            self.http_token = _env("HTTP_TOKEN")
+            self.cors_origins = _env("CORS_ORIGINS")
 
-        if candidate in {"1", "true", "yes", "on"}:
-            return True
-        if candidate in {"0", "false", "no", "off"}:
-            return False
+            self.allowed_schemas = _split_csv(_env("ALLOWED_SCHEMAS"), ["public"])
 
-        raise ValueError("DB_USE_SSL must be a boolean value")
+            self.db_debug_logging = _env_bool("DB_DEBUG", default=False)
 
-    @field_validator("tls_cafile", "tls_certfile", "tls_keyfile", mode="before")
-    @classmethod
-    def _validate_optional_path(cls, value: Any) -> str | None:
-        if value is None:
-            return None
+            self.backup_nodes = _validate_backup_nodes(_env("DB_BACKUP_NODES"))
 
-        candidate = str(value).strip()
-        if not candidate:
-            return None
-        return candidate
+            self.tls_mode = _validate_tls_mode(_env("DB_TLSMODE"))
+            self.use_ssl = _validate_use_ssl(_env("DB_USE_SSL"))
+            self.tls_cafile = _validate_optional_path(_env("DB_TLS_CAFILE"))
+            self.tls_certfile = _validate_optional_path(_env("DB_TLS_CERTFILE"))
+            self.tls_keyfile = _validate_optional_path(_env("DB_TLS_KEYFILE"))
 
-    @field_validator("backup_nodes", mode="before")
-    @classmethod
-    def _validate_backup_nodes(cls, value: Any) -> list[tuple[str, int]]:
-        if value is None:
-            return []
-
-        if isinstance(value, list):
-            normalised: list[tuple[str, int]] = []
-            for item in value:
-                if isinstance(item, tuple) and len(item) == 2:
-                    host, port = item
-                elif isinstance(item, dict):
-                    host = item.get("host")
-                    port = item.get("port")
-                else:
-                    raise ValueError(
-                        "DB_BACKUP_NODES must be a comma-separated list of host[:port] entries"
-                    )
-
-                if host is None or str(host).strip() == "":
-                    raise ValueError(
-                        "DB_BACKUP_NODES entries must include a hostname before the colon"
-                    )
-                try:
-                    port_int = int(port)
-                except (TypeError, ValueError) as exc:  # pragma: no cover - defensive
-                    raise ValueError("DB_BACKUP_NODES port values must be integers") from exc
-
-                if not 1 <= port_int <= 65535:
-                    raise ValueError(
-                        "DB_BACKUP_NODES ports must be between 1 and 65535"
-                    )
-
-                normalised.append((str(host).strip(), port_int))
-            return normalised
-
-        if isinstance(value, str):
-            return _parse_backup_nodes(value)
-
-        raise ValueError(
-            "DB_BACKUP_NODES must be provided as a comma-separated string"
-        )
+        self._database_source = "environment"
+
+        if self.connection_attempts < 1:
+            raise SettingsError("DB_CONNECTION_RETRIES must be at least 1")
+        if self.connection_retry_backoff_s < 0:
+            raise SettingsError("DB_CONNECTION_RETRY_BACKOFF_S must not be negative")
+        if self.connection_retry_max_s < 0:
+            raise SettingsError("DB_CONNECTION_RETRY_MAX_S must not be negative")
+        if self.pool_idle_timeout_s < 0:
+            raise SettingsError("POOL_IDLE_TIMEOUT_S must not be negative")
+        if not self.allowed_schemas:
+            raise SettingsError("At least one allowed schema must be configured")
 
     @property
     def default_schema(self) -> str:
         return self.allowed_schemas[0]
 
-    def allowed_schema_set(self) -> set[str]:
-        return {schema.lower() for schema in self.allowed_schemas}
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        cache = _DERIVED_CACHES.get(name)
+        if cache is not None:
+            # Rebuilt lazily by the accessor on its next call.
+            object.__setattr__(self, cache, None)
+
+    def allowed_schema_set(self) -> frozenset[str]:
+        cached = self._allowed_schema_set
+        if cached is None:
+            cached = frozenset(schema.lower() for schema in self.allowed_schemas)
+            self._allowed_schema_set = cached
+        return cached
 
     def using_placeholder_credentials(self) -> bool:
         """Return ``True`` when the Vertica credentials look like repo defaults."""
@@ -423,11 +463,12 @@ class Settings(BaseModel):
     def apply_database_overrides(self, overrides: DatabaseOverrides) -> None:
         """Apply runtime database configuration provided via the HTTP API."""
 
-        data = overrides.model_dump()
-        updated = self.model_copy(update=data)
-
-        for key in ("host", "port", "user", "password", "database"):
-            object.__setattr__(self, key, getattr(updated, key))
+        # ``DatabaseOverrides`` has already validated these values.
+        self.host = overrides.host
+        self.port = overrides.port
+        self.user = overrides.user
+        self.password = overrides.password
+        self.database = overrides.database
 
         self._database_source = "runtime"
 
@@ -436,13 +477,19 @@ class Settings(BaseModel):
 
         refreshed = type(self)()
 
-        for key, value in refreshed.model_dump().items():
-            object.__setattr__(self, key, value)
+        for item in fields(self):
+            setattr(self, item.name, getattr(refreshed, item.name))
+
+    def vertica_connection_options(self) -> Mapping[str, Any]:
+        """Return keyword arguments for :func:`vertica_python.connect`.
 
-        self._database_source = refreshed.database_source
+        The mapping is built once and shared until one of the fields it is
+        derived from changes, so it is returned read-only.
+        """
 
-    def vertica_connection_options(self) -> dict[str, Any]:
-        """Return keyword arguments for :func:`vertica_python.connect`."""
+        cached = self._connection_options
+        if cached is not None:
+            return cached
 
         options: dict[str, Any] = {
             "host": self.host,
@@ -474,12 +521,34 @@ class Settings(BaseModel):
         if self.use_ssl is not None:
             options["ssl"] = self.use_ssl
 
-        return options
+        cached = self._connection_options = MappingProxyType(options)
+        return cached
+
 
+@functools.cache
+def get_settings() -> Settings:
+    """Return the process-wide :class:`Settings`, building it on first use.
 
-try:
-    settings = Settings()
-except ValidationError as exc:  # pragma: no cover - startup configuration must succeed
-    logging.basicConfig(level=logging.ERROR)
-    LOGGER.error("Critical configuration validation failed: %s", exc)
-    raise
+    The shared ``.env`` file is loaded first so the settings never fall back
+    to placeholder defaults when the project-wide environment definition is
+    missing; :func:`ensure_dotenv` aborts with a clear error if the file
+    cannot be located or parsed.  Importing this module performs no I/O.
+    """
+
+    ensure_dotenv()
+    try:
+        return Settings()
+    except SettingsError as exc:  # pragma: no cover - startup configuration must succeed
+        logging.basicConfig(level=logging.ERROR)
+        LOGGER.error("Critical configuration validation failed: %s", exc)
+        raise
+
+
+def __getattr__(name: str) -> Any:
+    # ``settings`` is resolved lazily so importing the package (or a module
+    # that only needs the helpers above) does not read and validate the
+    # environment up front.  ``from .config import settings`` still works and
+    # always yields the shared instance.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -21,6 +21,9 @@ logger = logging.getLogger("mcp_vertica.env")
 
 _DOTENV_LOADED = False
 
+# Repository root (``src/mcp_vertica/env.py`` -> repo), resolved once.
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
 
 def _candidate_paths() -> list[Path]:
     """Return possible locations for the MCP ``.env`` file."""
@@ -33,12 +36,55 @@ def _candidate_paths() -> list[Path]:
 
     candidates = [Path(path).expanduser() for path in overrides]
 
-    project_root = Path(__file__).resolve().parent.parent.parent
-    candidates.append(project_root / ".env")
+    candidates.append(_PROJECT_ROOT / ".env")
 
     return candidates
 
 
+# Characters that need python-dotenv's full grammar (quoting, escapes,
+# variable interpolation, inline comments); files using them skip the fast
+# path.
+_COMPLEX_VALUE_CHARS = frozenset("'\"\\$#")
+
+
+def _load_simple_env(path: Path) -> bool | None:
+    """Load a plain ``KEY=VALUE`` file without python-dotenv.
+
+    Returns ``None`` when the file uses syntax this parser does not handle so
+    the caller can fall back to :func:`dotenv.load_dotenv`.  Otherwise mirrors
+    ``load_dotenv``: existing variables are not overridden and the result is
+    ``True`` when the file defined at least one variable.
+    """
+
+    try:
+        # ``utf-8-sig`` drops the BOM some Windows editors write, as
+        # python-dotenv does; otherwise it would prefix the first key.
+        text = path.read_text(encoding="utf-8-sig")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    parsed: dict[str, str] = {}
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+        key, sep, value = line.partition("=")
+        key = key.strip()
+        value = value.strip()
+        if (
+            not sep
+            or not key
+            or key.startswith("export ")
+            or not _COMPLEX_VALUE_CHARS.isdisjoint(value)
+        ):
+            return None
+        parsed[key] = value
+
+    for key, value in parsed.items():
+        os.environ.setdefault(key, value)
+    return bool(parsed)
+
+
 def ensure_dotenv() -> None:
     """Load the project ``.env`` file exactly once.
 
@@ -76,7 +122,9 @@ def ensure_dotenv() -> None:
 
     dotenv_path = existing_path
 
-    loaded = load_dotenv(dotenv_path)
+    loaded = _load_simple_env(dotenv_path)
+    if loaded is None:
+        loaded = load_dotenv(dotenv_path)
     if not loaded:
         message = (
             f"Failed to load environment variables from {dotenv_path}. "
@@ -2,30 +2,54 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import sys
+import time
 from collections import deque
 from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import Any, Deque, Dict, Mapping
 
 _LOGGER = logging.getLogger("mcp_vertica.logging")
 
-_ERROR_HISTORY_LIMIT = 50
-try:
-    _ERROR_HISTORY_LIMIT = max(
-        1, int(os.getenv("MCP_ERROR_HISTORY_LIMIT", str(_ERROR_HISTORY_LIMIT)))
-    )
-except ValueError:
-    _ERROR_HISTORY_LIMIT = 50
 
-_ERROR_HISTORY: Deque[Dict[str, Any]] = deque(maxlen=_ERROR_HISTORY_LIMIT)
+def _parse_int_env(name: str, default: int, *, minimum: int) -> int:
+    """Return ``name`` parsed as an integer of at least ``minimum``."""
+
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        return max(minimum, int(raw))
+    except ValueError:
+        return default
+
+
+_ERROR_HISTORY_LIMIT = _parse_int_env("MCP_ERROR_HISTORY_LIMIT", 50, minimum=1)
+
+# ``(recorded_at, entry)`` pairs; the epoch timestamp is only formatted when
+# the history is actually read, which healthy services rarely do.
+_ERROR_HISTORY: Deque[tuple[float, Dict[str, Any]]] = deque(maxlen=_ERROR_HISTORY_LIMIT)
 
 _CONFIGURED = False
 
+_FORMATTER = logging.Formatter(
+    "%(asctime)s %(levelname)s [%(name)s] %(message)s", "%Y-%m-%d %H:%M:%S"
+)
+# Root handler installed by ``configure_logging``; reconfiguring reuses it.
+_HANDLER: logging.StreamHandler | None = None
 
-def _debug_level_from_env(raw: str | None) -> tuple[int, int]:
-    """Return the logging level and parsed DEBUG value."""
+# Whether errors should also be emitted as GitHub Actions annotations.  Read
+# once here and refreshed by ``configure_logging`` rather than on every
+# ``record_service_error`` call.
+_GITHUB_ACTIONS = os.environ.get("GITHUB_ACTIONS") == "true"
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_debug_level(raw: str | None) -> tuple[int, int] | None:
+    """Map a raw DEBUG value to ``(level, debug_value)``; ``None`` if invalid."""
 
     if raw is None:
         return logging.WARNING, 0
@@ -37,8 +61,7 @@ def _debug_level_from_env(raw: str | None) -> tuple[int, int]:
     try:
         debug_value = int(candidate)
     except ValueError:
-        _LOGGER.warning("Invalid DEBUG value %r; defaulting to WARNING level", raw)
-        return logging.WARNING, 0
+        return None
 
     debug_value = max(0, min(debug_value, 3))
     if debug_value == 0:
@@ -50,29 +73,57 @@ def _debug_level_from_env(raw: str | None) -> tuple[int, int]:
     return logging.DEBUG, debug_value
 
 
+def _debug_level_from_env(raw: str | None) -> tuple[int, int]:
+    """Return the logging level and parsed DEBUG value."""
+
+    parsed = _parse_debug_level(raw)
+    if parsed is None:
+        _LOGGER.warning("Invalid DEBUG value %r; defaulting to WARNING level", raw)
+        return logging.WARNING, 0
+    return parsed
+
+
+@functools.cache
+def _managed_loggers() -> tuple[logging.Logger, ...]:
+    return tuple(
+        logging.getLogger(name) for name in ("uvicorn", "uvicorn.error", "uvicorn.access")
+    )
+
+
 def configure_logging(*, force: bool = False) -> None:
     """Initialise application logging according to the DEBUG environment variable."""
 
-    global _CONFIGURED
+    global _CONFIGURED, _GITHUB_ACTIONS, _HANDLER
 
     if _CONFIGURED and not force:
         return
 
-    debug_env = os.getenv("DEBUG")
+    _GITHUB_ACTIONS = os.environ.get("GITHUB_ACTIONS") == "true"
+
+    debug_env = os.environ.get("DEBUG")
     level, parsed_debug = _debug_level_from_env(debug_env)
 
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-        stream=sys.stdout,
-        force=True,
-    )
+    root = logging.getLogger()
+    if _HANDLER is not None and _HANDLER in root.handlers:
+        # Already installed: point it at the current stdout (which may have
+        # been swapped, e.g. by test capture) instead of rebuilding it.  A
+        # plain assignment avoids ``setStream`` flushing a stale stream.
+        _HANDLER.stream = sys.stdout
+    else:
+        # First configuration replaces whatever handlers were present, as
+        # ``logging.basicConfig(force=True)`` would.
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+            handler.close()
+        _HANDLER = logging.StreamHandler(sys.stdout)
+        _HANDLER.setFormatter(_FORMATTER)
+        root.addHandler(_HANDLER)
+    root.setLevel(level)
 
     # Align commonly used third party loggers with the configured level so they
     # remain visible during debugging sessions.
-    for logger_name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
-        logging.getLogger(logger_name).setLevel(level)
+    for managed in _managed_loggers():
+        managed.setLevel(level)
 
     _LOGGER.info("Configured logging level %s (DEBUG=%s)", logging.getLevelName(level), parsed_debug)
 
@@ -85,11 +136,18 @@ def record_service_error(
     message: str,
     exception: Exception | None = None,
     context: Mapping[str, Any] | None = None,
+    copy_context: bool = True,
 ) -> Dict[str, Any]:
-    """Record a service error for surfacing via health endpoints and CI logs."""
+    """Record a service error for surfacing via health endpoints and CI logs.
 
+    The returned entry omits ``timestamp``; it is added when the entry is read
+    back through :func:`recent_errors`.  ``context`` is copied unless
+    ``copy_context`` is false, which callers may pass when they hand over a
+    freshly built dict they never touch again.
+    """
+
+    recorded_at = time.time()
     entry: Dict[str, Any] = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
         "source": source,
         "message": message,
     }
@@ -99,27 +157,46 @@ def record_service_error(
         entry["error"] = str(exception)
 
     if context:
-        entry["context"] = dict(context)
+        if copy_context or not isinstance(context, dict):
+            entry["context"] = dict(context)
+        else:
+            # ``recent_errors`` materialises the view on read.
+            entry["context"] = MappingProxyType(context)
+
+    _ERROR_HISTORY.append((recorded_at, entry))
+
+    if _GITHUB_ACTIONS:
+        if exception is None:
+            annotation = f"::error title={source}::{message}\n"
+        else:
+            annotation = (
+                f"::error title={source}::{message} "
+                f"({exception.__class__.__name__}: {exception})\n"
+            )
+        sys.stdout.write(annotation)
+        sys.stdout.flush()
 
-    _ERROR_HISTORY.append(entry)
+    return entry
 
-    if os.getenv("GITHUB_ACTIONS") == "true":
-        annotation = message
-        if exception is not None:
-            annotation = f"{message} ({exception.__class__.__name__}: {exception})"
-        print(f"::error title={source}::{annotation}", file=sys.stdout, flush=True)
 
-    return entry
+def _render_error(recorded_at: float, entry: Dict[str, Any]) -> Dict[str, Any]:
+    timestamp = datetime.fromtimestamp(recorded_at, timezone.utc).isoformat()
+    rendered = {"timestamp": timestamp, **entry}
+    context = rendered.get("context")
+    if context is not None:
+        rendered["context"] = dict(context)
+    return rendered
 
 
 def recent_errors(limit: int | None = None) -> list[Dict[str, Any]]:
     """Return a list of the most recent recorded errors."""
 
+    history = _ERROR_HISTORY
     if limit is not None:
         if limit <= 0:
             return []
-        return list(_ERROR_HISTORY)[-limit:]
-    return list(_ERROR_HISTORY)
+        history = list(history)[-limit:]
+    return [_render_error(recorded_at, entry) for recorded_at, entry in history]
 
 
 def clear_error_history() -> None:
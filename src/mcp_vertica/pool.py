@@ -4,22 +4,105 @@ from __future__ import annotations
 
 import errno
 import logging
+import random
 import re
 import socket
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime, timezone, timedelta
-from queue import Empty, Queue
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict
 
-import vertica_python
+from .config import get_settings
 
-from .config import settings
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import vertica_python
 
 
 logger = logging.getLogger("mcp_vertica.pool")
 
-_POOL = Queue(maxsize=settings.pool_size)
+
+def _driver():
+    """Return :mod:`vertica_python`, importing it on first use.
+
+    The driver pulls in a sizeable dependency tree, so processes that never
+    open a connection (``--help``, liveness probes) skip the import cost.
+    """
+
+    import vertica_python
+
+    return vertica_python
+
+
+def __getattr__(name: str) -> Any:
+    # ``pool.vertica_python`` keeps resolving to the driver module for callers
+    # (and tests) that reach it through this module.
+    if name == "vertica_python":
+        return _driver()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _ConnectionPool:
+    """FIFO store of idle connections guarded by a single plain lock.
+
+    ``queue.Queue`` pays for condition variables that only matter for
+    blocking callers; the pool never blocks, so a deque and a lock held for
+    one append or pop are enough.  Each connection is stored with the
+    monotonic time it was returned so idle ones can be recycled.  When full,
+    the pool behaves as a ring buffer: the longest-idle connection makes
+    room for the one being returned.
+    ``qsize``/``maxsize`` mirror the ``Queue`` attributes used by the health
+    endpoint.
+    """
+
+    __slots__ = ("maxsize", "_idle", "_lock")
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self.maxsize = maxsize
+        self._idle: deque[tuple[Any, float]] = deque()
+        self._lock = threading.Lock()
+
+    def take(self) -> tuple[Any, float] | None:
+        """Return ``(connection, idle_since)``, or ``None`` when empty."""
+
+        with self._lock:
+            return self._idle.popleft() if self._idle else None
+
+    def give(self, conn: Any) -> Any | None:
+        """Store *conn* for reuse.
+
+        Returns the connection evicted to make room, which the caller must
+        close, or ``None`` when the pool had space.
+        """
+
+        idle_since = time.monotonic()
+        evicted = None
+        with self._lock:
+            if 0 < self.maxsize <= len(self._idle):
+                evicted, _ = self._idle.popleft()
+            self._idle.append((conn, idle_since))
+        return evicted
+
+    def drain(self) -> list[Any]:
+        with self._lock:
+            drained = [conn for conn, _ in self._idle]
+            self._idle.clear()
+        return drained
+
+    def qsize(self) -> int:
+        return len(self._idle)
+
+
+# Built on first use by ``_get_pool`` so importing this module does not force
+# the settings to be resolved.
+_POOL: _ConnectionPool | None = None
+# Guards building and replacing ``_POOL`` so concurrent first callers share
+# one pool instead of each building their own.
+_POOL_LOCK = threading.Lock()
+# Upper bound on threads used to close drained connections in ``reset_pool``.
+_RESET_CLOSE_WORKERS = 8
 
 
 _SENSITIVE_KEYS = ("password", "token", "secret")
@@ -37,6 +120,10 @@ _AUTHORIZATION_PATTERN = re.compile(
     re.IGNORECASE,
 )
 _BEARER_PATTERN = re.compile(r"(Bearer\s+)([^\s,;]+)", re.IGNORECASE)
+# Every pattern above requires one of these words, so text containing none of
+# them (the usual case) can skip the regex passes.
+_SENSITIVE_MARKERS = (*_SENSITIVE_KEYS, "authorization", "bearer")
+_QUOTE_CHARS = frozenset("'\"")
 
 
 def _redact_sensitive_text(text: str) -> str:
@@ -45,6 +132,13 @@ def _redact_sensitive_text(text: str) -> str:
     if not text:
         return text
 
+    folded = text.casefold()
+    has_key = any(key in folded for key in _SENSITIVE_KEYS)
+    has_authorization = "authorization" in folded
+    has_bearer = "bearer" in folded
+    if not (has_key or has_authorization or has_bearer):
+        return text
+
     def _quoted_repl(match: re.Match[str]) -> str:
         return (
             f"{match.group('key_quote')}{match.group('key')}{match.group('key_quote')}: "
@@ -60,10 +154,19 @@ def _redact_sensitive_text(text: str) -> str:
         scheme = match.group("scheme") or ""
         return f"{match.group('prefix')}{scheme}<redacted>"
 
-    redacted = _QUOTED_SENSITIVE_PATTERN.sub(_quoted_repl, text)
-    redacted = _AUTHORIZATION_PATTERN.sub(_authorization_repl, redacted)
-    redacted = _UNQUOTED_SENSITIVE_PATTERN.sub(_unquoted_repl, redacted)
-    redacted = _BEARER_PATTERN.sub(lambda m: f"{m.group(1)}<redacted>", redacted)
+    # The passes must stay separate and in this order: a single alternation
+    # lets an earlier match swallow a later key and leak its value.  The
+    # replacements never introduce a keyword, so a pass whose keyword is
+    # absent from the original text cannot match and is skipped.
+    redacted = text
+    if has_key and not _QUOTE_CHARS.isdisjoint(text):
+        redacted = _QUOTED_SENSITIVE_PATTERN.sub(_quoted_repl, redacted)
+    if has_authorization:
+        redacted = _AUTHORIZATION_PATTERN.sub(_authorization_repl, redacted)
+    if has_key:
+        redacted = _UNQUOTED_SENSITIVE_PATTERN.sub(_unquoted_repl, redacted)
+    if has_bearer:
+        redacted = _BEARER_PATTERN.sub(lambda m: f"{m.group(1)}<redacted>", redacted)
     return redacted
 
 
@@ -72,30 +175,49 @@ def _exception_summary(exc: Exception) -> tuple[str, str | None]:
     return exc.__class__.__name__, message or None
 
 
+_UTC = timezone.utc
+
+
 def _utcnow() -> datetime:
-    return datetime.now(timezone.utc)
+    return datetime.now(_UTC)
 
 
 def _isoformat(dt: datetime | None) -> str | None:
-    if dt is None:
-        return None
-    return dt.astimezone(timezone.utc).isoformat()
+    # Every timestamp here comes from ``_utcnow`` (plus a timedelta), so it is
+    # already UTC and needs no conversion.
+    return None if dt is None else dt.isoformat()
+
+
+# Backoff multipliers; exponents past the end reuse the last entry.
+_POW2 = tuple(float(1 << i) for i in range(32))
 
 
-def _exponential_backoff_delay(base: float, attempt: int) -> float:
+def _exponential_backoff_delay(base: float, attempt: int, cap: float = 0.0) -> float:
+    """Return a "full jitter" delay drawn from ``[0, base * 2**(attempt-1))``.
+
+    Randomising the whole interval stops clients that failed together (for
+    example after a Vertica restart) from retrying in lockstep. A positive
+    ``cap`` bounds the interval so long retry chains stop doubling.
+    """
+
     if base <= 0:
         return 0.0
-    exponent = max(0, attempt - 1)
-    return float(base) * (2 ** exponent)
+    exponent = min(max(0, attempt - 1), len(_POW2) - 1)
+    upper = float(base) * _POW2[exponent]
+    if cap > 0:
+        upper = min(upper, cap)
+    return random.random() * upper
 
 
 def _default_retry_state() -> Dict[str, Any]:
+    settings = get_settings()
     return {
         "in_progress": False,
         "attempts": 0,
         "max_attempts": max(1, settings.connection_attempts),
-        "strategy": "exponential",
+        "strategy": "exponential-jitter",
         "base_backoff_s": max(0.0, settings.connection_retry_backoff_s),
+        "max_backoff_s": max(0.0, settings.connection_retry_max_s),
         "last_failure": None,
         "last_exception": None,
         "last_failure_at": None,
@@ -106,55 +228,84 @@ def _default_retry_state() -> Dict[str, Any]:
     }
 
 
-_RETRY_STATE: Dict[str, Any] = _default_retry_state()
+# Filled from the settings on first use.
+_RETRY_STATE: Dict[str, Any] = {}
+
+
+def _retry_state() -> Dict[str, Any]:
+    global _RETRY_STATE
+
+    if not _RETRY_STATE:
+        _RETRY_STATE = _default_retry_state()
+    return _RETRY_STATE
+
+
+def _update_retry_state(**changes: Any) -> None:
+    _retry_state().update(changes)
 
 
-def _update_retry_context(*, attempts: int, base_backoff: float) -> None:
-    _RETRY_STATE.update(
+def _get_pool() -> _ConnectionPool:
+    global _POOL
+
+    pool = _POOL
+    if pool is None:
+        with _POOL_LOCK:
+            pool = _POOL
+            if pool is None:
+                pool = _POOL = _ConnectionPool(maxsize=get_settings().pool_size)
+    return pool
+
+
+def _update_retry_context(
+    *, attempts: int, base_backoff: float, max_backoff: float = 0.0
+) -> None:
+    _update_retry_state(
         max_attempts=attempts,
         base_backoff_s=max(0.0, base_backoff),
-        strategy="exponential",
+        max_backoff_s=max(0.0, max_backoff),
+        strategy="exponential-jitter",
     )
 
 
 def _record_retry_failure(
     *,
-    exc: Exception,
+    exc_name: str,
+    exc_message: str | None,
     attempt: int,
     max_attempts: int,
     base_backoff: float,
+    max_backoff: float = 0.0,
 ) -> float:
     now = _utcnow()
-    delay = _exponential_backoff_delay(base_backoff, attempt)
+    delay = _exponential_backoff_delay(base_backoff, attempt, max_backoff)
     if attempt >= max_attempts:
         delay = 0.0
 
-    exc_name, exc_message = _exception_summary(exc)
     in_progress = attempt < max_attempts
-    _RETRY_STATE.update(
+    if in_progress:
+        next_retry_in_s = round(delay, 3)
+        next_retry_at = _isoformat(now + timedelta(seconds=delay))
+    else:
+        next_retry_in_s = next_retry_at = None
+
+    # One update so readers never see a failure without its retry schedule.
+    _update_retry_state(
         in_progress=in_progress,
         attempts=attempt,
         last_failure=exc_message or exc_name,
         last_exception=exc_name,
         last_failure_at=_isoformat(now),
         exhausted=not in_progress,
+        next_retry_in_s=next_retry_in_s,
+        next_retry_at=next_retry_at,
     )
 
-    if in_progress:
-        next_retry_at = now + timedelta(seconds=delay)
-        _RETRY_STATE.update(
-            next_retry_in_s=round(delay, 3),
-            next_retry_at=_isoformat(next_retry_at),
-        )
-    else:
-        _RETRY_STATE.update(next_retry_in_s=None, next_retry_at=None)
-
     return delay
 
 
 def _record_retry_success(attempt: int) -> None:
     now = _utcnow()
-    _RETRY_STATE.update(
+    _update_retry_state(
         in_progress=False,
         attempts=attempt,
         next_retry_in_s=None,
@@ -165,7 +316,7 @@ def _record_retry_success(attempt: int) -> None:
 
 
 def connection_retry_state() -> Dict[str, Any]:
-    return dict(_RETRY_STATE)
+    return dict(_retry_state())
 
 
 class VerticaConnectionSetupError(RuntimeError):
@@ -178,11 +329,16 @@ _AUTH_FAILURE_MARKERS = (
     "invalid credentials",
     "fatal 28000",
 )
+_AUTH_FAILURE_RE = re.compile(
+    "|".join(map(re.escape, _AUTH_FAILURE_MARKERS)), re.IGNORECASE
+)
 
 
 def _classify_connection_exception(exc: Exception) -> Exception:
     """Return a rich error for well understood connection failures."""
 
+    settings = get_settings()
+
     if isinstance(exc, socket.gaierror):
         message = exc.strerror or str(exc)
         return VerticaConnectionSetupError(
@@ -211,9 +367,8 @@ def _classify_connection_exception(exc: Exception) -> Exception:
                 % (settings.host, settings.port)
             )
 
-    if isinstance(exc, vertica_python.errors.ConnectionError):
-        message = str(exc).lower()
-        if any(marker in message for marker in _AUTH_FAILURE_MARKERS):
+    if isinstance(exc, _driver().errors.ConnectionError):
+        if _AUTH_FAILURE_RE.search(str(exc)):
             return VerticaConnectionSetupError(
                 (
                     "Authentication failed for Vertica user '%s'. "
@@ -226,39 +381,58 @@ def _classify_connection_exception(exc: Exception) -> Exception:
 
 
 def _new_conn():
-    return vertica_python.connect(**settings.vertica_connection_options())
+    return _driver().connect(**get_settings().vertica_connection_options())
+
+
+_ATTEMPT_FAILED_LOG = "Failed to establish Vertica connection (attempt %s/%s): %s"
+_ATTEMPT_FAILED_DETAIL_LOG = _ATTEMPT_FAILED_LOG + ": %s"
+_EXHAUSTED_LOG = (
+    "Exhausted %s attempts to establish Vertica connection to %s:%s/%s as %s: %s"
+)
+_EXHAUSTED_DETAIL_LOG = _EXHAUSTED_LOG + ": %s"
 
 
 def _connect_with_retry():
+    settings = get_settings()
     attempts = max(1, settings.connection_attempts)
     backoff = settings.connection_retry_backoff_s
+    max_backoff = settings.connection_retry_max_s
+    debug = settings.db_debug_logging
+    failure_level = logging.ERROR if debug else logging.WARNING
     last_exc: Exception | None = None
 
-    _update_retry_context(attempts=attempts, base_backoff=backoff)
-
     for attempt in range(1, attempts + 1):
         try:
             conn = _new_conn()
         except Exception as exc:  # pragma: no cover - exercised via unit tests
             last_exc = exc
+            if attempt == 1:
+                _update_retry_context(
+                    attempts=attempts, base_backoff=backoff, max_backoff=max_backoff
+                )
             exc_name, exc_message = _exception_summary(exc)
-            log_message = (
-                "Failed to establish Vertica connection (attempt %s/%s)"
-            )
-            if exc_message:
-                log_message += ": %s: %s"
-                log_args = (attempt, attempts, exc_name, exc_message)
-            else:
-                log_message += ": %s"
-                log_args = (attempt, attempts, exc_name)
-
-            if settings.db_debug_logging:
-                logger.error(log_message, *log_args)
-            else:
-                logger.warning(log_message, *log_args)
+            if logger.isEnabledFor(failure_level):
+                if exc_message:
+                    logger.log(
+                        failure_level,
+                        _ATTEMPT_FAILED_DETAIL_LOG,
+                        attempt,
+                        attempts,
+                        exc_name,
+                        exc_message,
+                    )
+                else:
+                    logger.log(
+                        failure_level, _ATTEMPT_FAILED_LOG, attempt, attempts, exc_name
+                    )
 
             delay = _record_retry_failure(
-                exc=exc, attempt=attempt, max_attempts=attempts, base_backoff=backoff
+                exc_name=exc_name,
+                exc_message=exc_message,
+                attempt=attempt,
+                max_attempts=attempts,
+                base_backoff=backoff,
+                max_backoff=max_backoff,
             )
 
             if attempt == attempts:
@@ -279,74 +453,129 @@ def _connect_with_retry():
                     attempts,
                 )
         else:
-            if settings.db_debug_logging:
+            if debug:
                 logger.debug(
                     "Established Vertica connection on attempt %s", attempt
                 )
-            _record_retry_success(attempt)
+            # A first-attempt success with no earlier failure outstanding is
+            # the steady state; leave the retry state alone.
+            state = _retry_state()
+            if attempt > 1 or state["in_progress"] or state["exhausted"]:
+                _record_retry_success(attempt)
             return conn
 
     assert last_exc is not None
     classified = _classify_connection_exception(last_exc)
-    last_exc_name, last_exc_message = _exception_summary(last_exc)
-    if last_exc_message:
-        logger.error(
-            "Exhausted %s attempts to establish Vertica connection to %s:%s/%s as %s: %s: %s",
-            attempts,
-            settings.host,
-            settings.port,
-            settings.database,
-            settings.user,
-            last_exc_name,
-            last_exc_message,
+    if logger.isEnabledFor(logging.ERROR):
+        last_exc_name, last_exc_message = _exception_summary(last_exc)
+        template, summary = (
+            (_EXHAUSTED_DETAIL_LOG, (last_exc_name, last_exc_message))
+            if last_exc_message
+            else (_EXHAUSTED_LOG, (last_exc_name,))
         )
-    else:
         logger.error(
-            "Exhausted %s attempts to establish Vertica connection to %s:%s/%s as %s: %s",
+            template,
             attempts,
             settings.host,
             settings.port,
             settings.database,
             settings.user,
-            last_exc_name,
+            *summary,
         )
     if classified is last_exc:
         raise last_exc
     raise classified from last_exc
 
 
+def _connection_closed(conn: Any) -> bool:
+    """Return ``True`` when *conn* reports itself closed.
+
+    ``vertica_python`` connections expose ``closed()`` which only inspects
+    local socket state, so this costs no network round-trip.
+    """
+
+    closed = getattr(conn, "closed", None)
+    if not callable(closed):
+        return False
+    try:
+        return bool(closed())
+    except Exception:  # pragma: no cover - treat a broken check as dead
+        return True
+
+
+def _close_quietly(conn: Any, context: str) -> None:
+    try:
+        conn.close()
+    except Exception as exc:  # pragma: no cover - best effort cleanup
+        if get_settings().db_debug_logging:
+            logger.exception("Failed to close Vertica connection %s", context)
+        else:
+            logger.warning("Failed to close Vertica connection %s: %s", context, exc)
+
+
+def _checkout(pool: _ConnectionPool) -> Any | None:
+    """Return a live idle connection, recycling dead or long-idle ones."""
+
+    max_idle = get_settings().pool_idle_timeout_s
+    while (entry := pool.take()) is not None:
+        conn, idle_since = entry
+        if _connection_closed(conn):
+            logger.debug("Dropping closed Vertica connection from the pool")
+        elif max_idle and time.monotonic() - idle_since > max_idle:
+            logger.debug("Recycling Vertica connection idle for over %.0fs", max_idle)
+            _close_quietly(conn, "after idle timeout")
+        else:
+            return conn
+    return None
+
+
 @contextmanager
 def get_conn():
-    try:
-        conn = _POOL.get_nowait()
-    except Empty:
+    pool = _get_pool()
+    conn = _checkout(pool)
+    if conn is None:
         conn = _connect_with_retry()
     try:
         yield conn
     finally:
+        if _connection_closed(conn):
+            logger.debug("Not returning closed Vertica connection to the pool")
+        elif (evicted := pool.give(conn)) is not None:
+            logger.debug("Pool is full; closing the longest-idle Vertica connection")
+            _close_quietly(evicted, "after pool eviction")
+
+
+def warm_pool(n: int | None = None) -> int:
+    """Open connections until the pool holds *n* idle ones.
+
+    *n* defaults to the configured pool size.  Warming is best effort: it
+    makes a single attempt per connection, bypasses the retry bookkeeping and
+    stops at the first failure.  Returns the number of connections added.
+    """
+
+    pool = _get_pool()
+    target = get_settings().pool_size if n is None else n
+    if pool.maxsize:
+        target = min(target, pool.maxsize)
+
+    opened = 0
+    while pool.qsize() < target:
         try:
-            _POOL.put_nowait(conn)
-        except Exception as exc:  # pragma: no cover - defensive cleanup
-            if settings.db_debug_logging:
-                logger.exception(
-                    "Discarding Vertica connection; pool rejection raised an exception"
-                )
-            else:
-                logger.warning(
-                    "Discarding Vertica connection after pool rejection: %s", exc
-                )
-            try:
-                conn.close()
-            except Exception as close_exc:  # pragma: no cover - best effort cleanup
-                if settings.db_debug_logging:
-                    logger.exception(
-                        "Failed to close Vertica connection after pool rejection"
-                    )
-                else:
-                    logger.warning(
-                        "Failed to close Vertica connection after pool rejection: %s",
-                        close_exc,
-                    )
+            conn = _new_conn()
+        except Exception as exc:
+            exc_name, exc_message = _exception_summary(exc)
+            logger.warning(
+                "Stopped warming the Vertica pool after %s connection(s): %s",
+                opened,
+                f"{exc_name}: {exc_message}" if exc_message else exc_name,
+            )
+            break
+        opened += 1
+        if (evicted := pool.give(conn)) is not None:
+            # Another thread filled the pool in the meantime.
+            _close_quietly(evicted, "after pool eviction")
+            break
+    return opened
 
 
 def reset_pool() -> None:
@@ -354,29 +583,21 @@ def reset_pool() -> None:
 
     global _POOL
 
-    drained = []
-    queue = _POOL
-    if queue is not None:
-        while True:
-            try:
-                conn = queue.get_nowait()
-            except Empty:
-                break
-            else:
-                drained.append(conn)
-
-    for conn in drained:
-        try:
-            conn.close()
-        except Exception as exc:  # pragma: no cover - best effort cleanup
-            if settings.db_debug_logging:
-                logger.exception(
-                    "Failed to close Vertica connection during pool reset"
-                )
-            else:
-                logger.warning(
-                    "Failed to close Vertica connection during pool reset: %s",
-                    exc,
-                )
-
-    _POOL = Queue(maxsize=settings.pool_size)
+    settings = get_settings()
+
+    with _POOL_LOCK:
+        drained = _POOL.drain() if _POOL is not None else []
+        _POOL = _ConnectionPool(maxsize=settings.pool_size)
+
+    if len(drained) > 1:
+        # Each close is a network round-trip (TLS close_notify plus FIN), so
+        # overlap them instead of paying for them one after another.
+        with ThreadPoolExecutor(
+            max_workers=min(_RESET_CLOSE_WORKERS, len(drained)),
+            thread_name_prefix="vertica-pool-reset",
+        ) as executor:
+            for conn in drained:
+                executor.submit(_close_quietly, conn, "during pool reset")
+    else:
+        for conn in drained:
+            _close_quietly(conn, "during pool reset")
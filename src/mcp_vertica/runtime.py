@@ -5,7 +5,9 @@ from __future__ import annotations
 import json
 import logging
 import os
-from contextlib import suppress
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
 from ipaddress import ip_address
 from typing import Any, Dict, List
 from urllib.error import URLError
@@ -26,21 +28,87 @@ logger = logging.getLogger("mcp_vertica.runtime")
 _BIND_HOST_KEYS = ("LISTEN_HOST", "MCP_LISTEN_HOST", "BIND_HOST", "MCP_BIND_HOST")
 _BIND_PORT_KEYS = ("LISTEN_PORT", "MCP_LISTEN_PORT", "BIND_PORT", "MCP_BIND_PORT", "PORT")
 _PUBLIC_PORT_KEYS = ("PUBLIC_HTTP_PORT", "MCP_PUBLIC_HTTP_PORT")
+_LISTEN_HOST_ENV = (*_BIND_HOST_KEYS, "HOST", "ALLOW_LOOPBACK_LISTEN")
+_PUBLIC_PORT_ENV = (*_PUBLIC_PORT_KEYS, *_BIND_PORT_KEYS)
+_LOOPBACK_TRUTHY = frozenset({"1", "true", "yes", "on"})
+# Values that deserve the ALLOW_LOOPBACK_LISTEN hint when rejected.
+_LOOPBACK_LITERALS = frozenset({"127.0.0.1", "localhost", "::1"})
+
+# Bind settings are resolved on every health probe.  Results are memoised by
+# the raw values of the variables they depend on, so environment changes are
+# still honoured; resolutions that logged a warning are not stored so a
+# misconfiguration keeps being reported.
+_RESOLVED_HOSTS: Dict[tuple[str | None, ...], str] = {}
+_RESOLVED_PORTS: Dict[tuple[str | None, ...], int] = {}
+
+
+def _environ_snapshot(keys: tuple[str, ...]) -> tuple[str | None, ...]:
+    environ = os.environ
+    return tuple(environ.get(key) for key in keys)
+
+
+def _loopback_allowed(raw: str | None) -> bool:
+    return bool(raw) and raw.strip().lower() in _LOOPBACK_TRUTHY
 
 
 def allow_loopback_listen() -> bool:
     """Return ``True`` when loopback interfaces are allowed."""
 
-    return os.environ.get("ALLOW_LOOPBACK_LISTEN", "").strip().lower() in {
-        "1",
-        "true",
-        "yes",
-        "on",
+    return _loopback_allowed(os.environ.get("ALLOW_LOOPBACK_LISTEN"))
+
+
+_EXTERNAL_IP_PROVIDERS: tuple[tuple[str, str | None], ...] = (
+    ("https://api.ipify.org?format=json", "ip"),
+    ("https://ifconfig.co/json", "ip"),
+)
+# A host's external address is stable, so a successful lookup is reused for
+# this long instead of probing the providers on every health check.
+_EXTERNAL_IP_TTL_S = 60.0
+_EXTERNAL_IP_CACHE: tuple[float, Dict[str, Any]] | None = None
+
+
+def _probe_external_ip(
+    url: str, key: str | None, timeout: float
+) -> tuple[str | None, Dict[str, Any] | None]:
+    """Query one provider; return ``(ip, None)`` or ``(None, error)``."""
+
+    try:
+        with urlopen(url, timeout=timeout) as response:
+            raw = response.read().decode("utf-8")
+    except (TimeoutError, URLError, OSError) as exc:
+        return None, {
+            "source": url,
+            "error": str(exc),
+            "exception": exc.__class__.__name__,
+        }
+
+    try:
+        payload = json.loads(raw)
+    except json.JSONDecodeError as exc:
+        return None, {
+            "source": url,
+            "error": f"Failed to decode response: {exc}",
+            "exception": exc.__class__.__name__,
+        }
+
+    candidate = payload.get(key) if key else None
+    if candidate:
+        return str(candidate).strip(), None
+
+    return None, {
+        "source": url,
+        "error": f"Response missing expected key {key!r}",
     }
 
 
 def external_ip_info(*, timeout: float = 2.0) -> Dict[str, Any]:
-    """Best-effort discovery of the MCP runtime's external IP address."""
+    """Best-effort discovery of the MCP runtime's external IP address.
+
+    The providers are queried concurrently and the first answer wins, so a
+    slow or unreachable provider costs at most one *timeout*.
+    """
+
+    global _EXTERNAL_IP_CACHE
 
     configured = os.environ.get("EXTERNAL_IP", "").strip()
     if configured:
@@ -50,65 +118,51 @@ def external_ip_info(*, timeout: float = 2.0) -> Dict[str, Any]:
             "source": "environment",
         }
 
-    providers: List[tuple[str, str | None]] = [
-        ("https://api.ipify.org?format=json", "ip"),
-        ("https://ifconfig.co/json", "ip"),
-    ]
-
-    errors: List[Dict[str, Any]] = []
-    for url, key in providers:
-        try:
-            with urlopen(url, timeout=timeout) as response:
-                raw = response.read().decode("utf-8")
-        except (TimeoutError, URLError, OSError) as exc:
-            errors.append(
-                {
-                    "source": url,
-                    "error": str(exc),
-                    "exception": exc.__class__.__name__,
-                }
-            )
-            continue
-
-        try:
-            payload = json.loads(raw)
-        except json.JSONDecodeError as exc:
-            errors.append(
-                {
-                    "source": url,
-                    "error": f"Failed to decode response: {exc}",
-                    "exception": exc.__class__.__name__,
-                }
-            )
-            continue
+    cached = _EXTERNAL_IP_CACHE
+    if cached is not None and time.monotonic() - cached[0] < _EXTERNAL_IP_TTL_S:
+        return dict(cached[1])
 
-        candidate = payload.get(key) if key else None
-        if candidate:
-            return {
-                "ok": True,
-                "ip": str(candidate).strip(),
-                "source": url,
-            }
-
-        errors.append(
-            {
-                "source": url,
-                "error": f"Response missing expected key {key!r}",
-            }
-        )
-
-    return {"ok": False, "errors": errors}
+    providers = _EXTERNAL_IP_PROVIDERS
+    errors: List[Dict[str, Any] | None] = [None] * len(providers)
+    executor = ThreadPoolExecutor(
+        max_workers=len(providers), thread_name_prefix="external-ip"
+    )
+    try:
+        pending = {
+            executor.submit(_probe_external_ip, url, key, timeout): index
+            for index, (url, key) in enumerate(providers)
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                ip, error = future.result()
+                if ip:
+                    result = {"ok": True, "ip": ip, "source": providers[index][0]}
+                    _EXTERNAL_IP_CACHE = (time.monotonic(), result)
+                    return dict(result)
+                errors[index] = error
+    finally:
+        # Do not wait for a straggling provider once an answer is in.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return {"ok": False, "errors": [error for error in errors if error]}
 
 
 def resolve_listen_host(*, log: logging.Logger | None = None) -> str:
     """Determine the HTTP bind address for the MCP service."""
 
-    log = log or logger
+    snapshot = _environ_snapshot(_LISTEN_HOST_ENV)
+    cached = _RESOLVED_HOSTS.get(snapshot)
+    if cached is not None:
+        return cached
 
-    allow_loopback = allow_loopback_listen()
+    log = log or logger
+    *bind_values, legacy_host, loopback_raw = snapshot
+    allow_loopback = _loopback_allowed(loopback_raw)
+    clean = True
 
-    for key in _BIND_HOST_KEYS:
-        value = os.environ.get(key)
+    for key, value in zip(_BIND_HOST_KEYS, bind_values):
         if not value:
             continue
 
@@ -117,43 +171,61 @@ def resolve_listen_host(*, log: logging.Logger | None = None) -> str:
             continue
 
         if is_bindable_listen_host(candidate, allow_loopback=allow_loopback):
-            return candidate
+            break
 
+        clean = False
         log.warning(
             "Ignoring %s environment variable value %r; not a bindable interface.",
             key,
             value,
         )
-        if candidate in {"127.0.0.1", "localhost"} and not allow_loopback:
+        if candidate in _LOOPBACK_LITERALS and not allow_loopback:
             log.warning(
                 "Set ALLOW_LOOPBACK_LISTEN=1 to bind Vertica MCP to loopback interfaces explicitly.",
             )
-
-    legacy_host = os.environ.get("HOST")
-    if legacy_host and legacy_host.strip():
-        candidate = legacy_host.strip()
-        if is_bindable_listen_host(candidate):
-            return candidate
-        log.warning(
-            "Ignoring HOST environment variable value %r; set LISTEN_HOST to override the bind address.",
-            legacy_host,
-        )
-
-    return "0.0.0.0"
+    else:
+        candidate = "0.0.0.0"
+        if legacy_host and legacy_host.strip():
+            legacy_candidate = legacy_host.strip()
+            if is_bindable_listen_host(legacy_candidate, allow_loopback=allow_loopback):
+                candidate = legacy_candidate
+            else:
+                clean = False
+                log.warning(
+                    "Ignoring HOST environment variable value %r; set LISTEN_HOST to override the bind address.",
+                    legacy_host,
+                )
+
+    if clean:
+        _RESOLVED_HOSTS[snapshot] = candidate
+    return candidate
 
 
 def resolve_listen_port(*, log: logging.Logger | None = None) -> int:
     """Determine the TCP port for the MCP service."""
 
+    snapshot = _environ_snapshot(_BIND_PORT_KEYS)
+    cached = _RESOLVED_PORTS.get(snapshot)
+    if cached is not None:
+        return cached
+
     log = log or logger
+    clean = True
 
-    for key in _BIND_PORT_KEYS:
-        value = os.environ.get(key)
+    for key, value in zip(_BIND_PORT_KEYS, snapshot):
         port = _coerce_port(value, key, log=log)
         if port is not None:
-            return port
-
-    return 8000
+            break
+        # ``_coerce_port`` only returns ``None`` for a non-blank value after
+        # logging why it was rejected.
+        if value and value.strip():
+            clean = False
+    else:
+        port = 8000
+
+    if clean:
+        _RESOLVED_PORTS[snapshot] = port
+    return port
 
 
 def resolve_public_http_port(*, log: logging.Logger | None = None) -> int:
@@ -161,8 +233,8 @@ def resolve_public_http_port(*, log: logging.Logger | None = None) -> int:
 
     log = log or logger
 
-    for key in (*_PUBLIC_PORT_KEYS, *_BIND_PORT_KEYS):
-        port = _coerce_port(os.environ.get(key), key, log=log)
+    for key, value in zip(_PUBLIC_PORT_ENV, _environ_snapshot(_PUBLIC_PORT_ENV)):
+        port = _coerce_port(value, key, log=log)
         if port is not None:
             return port
 
@@ -194,20 +266,34 @@ def is_bindable_listen_host(value: str, *, allow_loopback: bool | None = None) -
     if not candidate:
         return False
 
-    if allow_loopback is None:
-        allow_loopback = allow_loopback_listen()
+    if candidate == "0.0.0.0":
+        return True
+
+    kind = _interface_kind(candidate)
+    if kind == "loopback":
+        return allow_loopback_listen() if allow_loopback is None else allow_loopback
+    return kind is not None
 
-    with suppress(ValueError):
-        ip = ip_address(candidate)
-        if ip.is_unspecified:
-            return True
-        if ip.is_loopback:
-            return allow_loopback
-        if ip.is_private:
-            return True
-        return False
 
-    return False
+@lru_cache(maxsize=64)
+def _interface_kind(candidate: str) -> str | None:
+    """Return ``unspecified``, ``loopback``, ``private`` or ``None``.
+
+    ``None`` covers public addresses and values that are not IP literals.
+    Cached because a process only ever sees a handful of bind hosts.
+    """
+
+    try:
+        ip = ip_address(candidate)
+    except ValueError:
+        return None
+    if ip.is_unspecified:
+        return "unspecified"
+    if ip.is_loopback:
+        return "loopback"
+    if ip.is_private:
+        return "private"
+    return None
 
 
 def _coerce_port(raw: str | None, key: str, *, log: logging.Logger) -> int | None:
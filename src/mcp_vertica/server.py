@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import functools
+import hmac
 import json
 import logging
 import os
@@ -11,17 +13,23 @@ import time
 from contextlib import suppress
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, Sequence
+from typing import Any, Dict, Sequence
 
 from fastapi import FastAPI, Query, Request, HTTPException
 from fastapi.exception_handlers import http_exception_handler
 from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the stdlib encoder
+    orjson = None
 
 from . import pool as pool_module
-from .config import DatabaseOverrides, settings
+from .config import DatabaseOverrides, get_settings
 from .logging_utils import recent_errors, record_service_error
 from .runtime import (
+    _LOOPBACK_LITERALS,
     allow_loopback_listen,
     external_ip_info,
     is_bindable_listen_host,
@@ -90,7 +98,27 @@ _CONNECTED_HOSTS = _ConnectedHostTracker()
 
 _SERVER_START_TIME = datetime.now(timezone.utc)
 
-app = FastAPI()
+if orjson is not None:
+
+    class _JSONResponse(JSONResponse):
+        """``JSONResponse`` rendered with orjson, which is several times faster
+        than the stdlib encoder on large ``/query`` payloads.
+
+        Content orjson rejects, such as integers beyond 64 bits from wide
+        NUMERIC columns, falls back to the stdlib encoder.
+        """
+
+        def render(self, content: Any) -> bytes:
+            try:
+                return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                return super().render(content)
+
+else:
+    _JSONResponse = JSONResponse
+
+
+app = FastAPI(default_response_class=_JSONResponse)
 
 
 def _client_identity(request: Request) -> str:
@@ -115,12 +143,18 @@ async def _unhandled_exception_handler(request: Request, exc: Exception):
         message=f"Unhandled server error while processing {request.method} {request.url.path}",
         exception=exc,
         context={"path": request.url.path, "method": request.method},
+        copy_context=False,
     )
-    return JSONResponse({"detail": "Internal Server Error"}, status_code=500)
+    return _JSONResponse({"detail": "Internal Server Error"}, status_code=500)
 
 
+@functools.cache
 def _service_version() -> str:
-    """Best effort determination of the deployed package version."""
+    """Best effort determination of the deployed package version.
+
+    Cached: the metadata lookup scans ``sys.path`` and the answer cannot
+    change while the process runs.
+    """
 
     try:
         return version("mcp-vertica")
@@ -129,19 +163,20 @@ def _service_version() -> str:
 
 
 def _pool_details() -> Dict[str, Any]:
-    details: Dict[str, Any] = {"configured_size": settings.pool_size}
-    queue = getattr(pool_module, "_POOL", None)
-    if queue is not None:
-        with suppress(Exception):
-            details["available"] = queue.qsize()
-        with suppress(Exception):
-            details["max_size"] = queue.maxsize
-    with suppress(Exception):
-        details["recovery"] = pool_module.connection_retry_state()
-    return details
+    configured_size = get_settings().pool_size
+    # Read the pool as it stands rather than building it from a health probe;
+    # ``qsize`` and ``maxsize`` are plain reads that never take the pool lock.
+    idle = pool_module._POOL
+    return {
+        "configured_size": configured_size,
+        "available": idle.qsize() if idle is not None else 0,
+        "max_size": idle.maxsize if idle is not None else configured_size,
+        "recovery": pool_module.connection_retry_state(),
+    }
 
 
 def _database_check() -> Dict[str, Any]:
+    settings = get_settings()
     pool_info = _pool_details()
     target = {
         "host": settings.host,
@@ -157,6 +192,7 @@ def _database_check() -> Dict[str, Any]:
             source="database",
             message=message,
             context={"target": target, "placeholder_credentials": True},
+            copy_context=False,
         )
         return {
             "ok": False,
@@ -167,23 +203,25 @@ def _database_check() -> Dict[str, Any]:
         }
 
     start = time.perf_counter()
-    cursor = None
     try:
         with pool_module.get_conn() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT 1")
-            cursor.fetchone()
+            # Closed before the connection goes back to the pool.
+            try:
+                cursor.execute("SELECT 1")
+                cursor.fetchone()
+            finally:
+                with suppress(Exception):
+                    cursor.close()
     except Exception as exc:  # pragma: no cover - exercised in unit tests
         latency = round((time.perf_counter() - start) * 1000, 3)
-        if cursor is not None:
-            with suppress(Exception):
-                cursor.close()
         logger.exception("Vertica connectivity check failed")
         record_service_error(
             source="database",
             message=f"Vertica connectivity check failed: {exc}",
             exception=exc,
             context={"target": target, "latency_ms": latency},
+            copy_context=False,
         )
         return {
             "ok": False,
@@ -201,17 +239,24 @@ def _database_check() -> Dict[str, Any]:
             "pool": pool_info,
             "target": target,
         }
-    finally:
-        if cursor is not None:
-            with suppress(Exception):
-                cursor.close()
+
+
+@functools.cache
+def _interpreter_details() -> tuple[str, str, str]:
+    return (
+        platform.python_version(),
+        platform.python_implementation(),
+        platform.platform(),
+    )
 
 
 def _runtime_diagnostics() -> Dict[str, Any]:
+    python_version, implementation, platform_name = _interpreter_details()
     return {
-        "python": platform.python_version(),
-        "implementation": platform.python_implementation(),
-        "platform": platform.platform(),
+        "python": python_version,
+        "implementation": implementation,
+        "platform": platform_name,
+        # Read live: the value changes in forked workers.
         "pid": os.getpid(),
         "service_version": _service_version(),
     }
@@ -242,6 +287,7 @@ def _runtime_status() -> Dict[str, Any]:
 
 
 def _config_diagnostics() -> Dict[str, Any]:
+    settings = get_settings()
     return {
         "database": {
             "host": settings.host,
@@ -266,41 +312,51 @@ def _config_diagnostics() -> Dict[str, Any]:
     }
 
 
-def _normalise_rows(rows: Iterable[Any]) -> list[Any]:
-    normalised: list[Any] = []
-    for row in rows:
-        if isinstance(row, (list, tuple)):
-            normalised.append(list(row))
-        else:
-            normalised.append(row)
-    return normalised
+_FETCH_BATCH_ROWS = 1000
+
+
+def _fetch_rows(cursor: Any) -> list[Any]:
+    """Fetch every row from *cursor* in batches.
+
+    Rows are passed through untouched: tuples and lists both encode as JSON
+    arrays, so converting them would only allocate.
+    """
+
+    rows: list[Any] = []
+    while batch := cursor.fetchmany(_FETCH_BATCH_ROWS):
+        rows.extend(batch)
+    return rows
 
 
 def _query_execution(query: str) -> Dict[str, Any]:
     trimmed = (query or "").strip()
     if not trimmed:
         return {"ok": False, "error": "Query must not be empty"}
-    if not trimmed.upper().startswith("SELECT "):
+    # Only the prefix needs case-folding; upper-casing the whole query would
+    # copy it.
+    if trimmed[:7].upper() != "SELECT ":
         return {"ok": False, "error": "Only SELECT statements are allowed"}
 
     start = time.perf_counter()
-    cursor = None
     try:
         with pool_module.get_conn() as conn:
             cursor = conn.cursor()
-            cursor.execute(trimmed)
-            rows = cursor.fetchall()
+            # Closed before the connection goes back to the pool.
+            try:
+                cursor.execute(trimmed)
+                rows = _fetch_rows(cursor)
+            finally:
+                with suppress(Exception):
+                    cursor.close()
     except Exception as exc:  # pragma: no cover - exercised in unit tests
         latency = round((time.perf_counter() - start) * 1000, 3)
-        if cursor is not None:
-            with suppress(Exception):
-                cursor.close()
         logger.exception("Vertica query execution failed")
         record_service_error(
             source="database",
             message=f"Vertica query execution failed: {exc}",
             exception=exc,
             context={"query": trimmed, "latency_ms": latency},
+            copy_context=False,
         )
         return {
             "ok": False,
@@ -313,13 +369,9 @@ def _query_execution(query: str) -> Dict[str, Any]:
         return {
             "ok": True,
             "latency_ms": latency,
-            "rows": _normalise_rows(rows),
+            "rows": rows,
             "row_count": len(rows),
         }
-    finally:
-        if cursor is not None:
-            with suppress(Exception):
-                cursor.close()
 
 
 def _resolve_host_override(host: str | None) -> str:
@@ -338,7 +390,7 @@ def _resolve_host_override(host: str | None) -> str:
         return candidate
 
     logger.warning("Ignoring CLI --host override %r; not a bindable interface.", host)
-    if candidate in {"127.0.0.1", "localhost"} and not allow_loopback:
+    if candidate in _LOOPBACK_LITERALS and not allow_loopback:
         logger.warning(
             "Set ALLOW_LOOPBACK_LISTEN=1 to bind Vertica MCP to loopback interfaces explicitly.",
         )
@@ -459,8 +511,13 @@ class QueryRequest(BaseModel):
 class DatabaseConfigRequest(DatabaseOverrides):
     """Pydantic model for runtime database configuration updates."""
 
+    # FastAPI inspects the request model when the route is registered, so
+    # build it eagerly rather than inheriting the deferred build.
+    model_config = ConfigDict(defer_build=False)
+
 
 def _database_state() -> Dict[str, Any]:
+    settings = get_settings()
     return {
         "host": settings.host,
         "port": settings.port,
@@ -474,6 +531,7 @@ def _database_state() -> Dict[str, Any]:
 def _supported_databases() -> list[Dict[str, Any]]:
     """Return the configured Vertica connection targets."""
 
+    settings = get_settings()
     supported: list[Dict[str, Any]] = [
         {
             "role": "primary",
@@ -501,6 +559,7 @@ def _supported_databases() -> list[Dict[str, Any]]:
 def _apply_database_override(overrides: DatabaseOverrides) -> Dict[str, Any]:
     """Apply a validated database override and reset the pool when available."""
 
+    settings = get_settings()
     logger.info("Applying runtime Vertica database configuration override")
     settings.apply_database_overrides(overrides)
     try:
@@ -559,7 +618,9 @@ async def configure_database(payload: DatabaseConfigRequest):
 
 def _health_response(*, ping_vertica: bool) -> Dict[str, Any]:
     if ping_vertica:
-        checks = {"database": _database_check()}
+        database = _database_check()
+        checks = {"database": database}
+        ok = bool(database.get("ok"))
     else:
         checks = {
             "database": {
@@ -568,8 +629,8 @@ def _health_response(*, ping_vertica: bool) -> Dict[str, Any]:
                 "message": "Set ping-vertica=true to run a live Vertica query",
             }
         }
+        ok = True
 
-    ok = all(check.get("ok") for check in checks.values())
     diagnostics = {
         "runtime": _runtime_diagnostics(),
         "config": _config_diagnostics(),
@@ -600,7 +661,7 @@ async def root() -> Dict[str, Any]:
 async def healthz(ping_vertica: bool = Query(False, alias="ping-vertica")):
     payload = _health_response(ping_vertica=ping_vertica)
     status = 200 if payload.get("ok") else 503
-    return JSONResponse(payload, status_code=status)
+    return _JSONResponse(payload, status_code=status)
 
 
 @app.get("/status", include_in_schema=False)
@@ -612,7 +673,7 @@ async def status():
     """
 
     payload = _health_response(ping_vertica=False)
-    return JSONResponse(payload, status_code=200)
+    return _JSONResponse(payload, status_code=200)
 
 
 @app.get("/diagnostics")
@@ -649,21 +710,46 @@ async def execute_query_endpoint(payload: QueryRequest):
     return _query_execution(payload.query)
 
 
+_OPEN_PATHS = frozenset({"/", "/healthz", "/status", "/info", "/api/info", "/sse"})
+
+
+@functools.lru_cache(maxsize=4)
+def _expected_authorization(token: str) -> bytes:
+    return f"Bearer {token}".encode("utf-8")
+
+
+def _raw_authorization(scope: Dict[str, Any]) -> bytes | None:
+    # ASGI servers lower-case header names, so the raw list can be scanned
+    # without building (and case-folding into) a ``Headers`` object.
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            return value
+    return None
+
+
+def _authorization_matches(provided: bytes, token: str) -> bool:
+    # Constant-time comparison so response timing does not leak how much of
+    # the token matched.
+    return hmac.compare_digest(provided, _expected_authorization(token))
+
+
 @app.middleware("http")
 async def bearer(request: Request, call_next):
-    token = settings.http_token
+    token = get_settings().http_token
     tracked_host: str | None = None
     if request.client is not None:
         tracked_host = await _CONNECTED_HOSTS.register(request.client.host)
 
     try:
-        if token and request.url.path not in ("/", "/healthz", "/status", "/info", "/api/info", "/sse"):
-            provided = request.headers.get("authorization")
-            if provided != f"Bearer {token}":
+        # ``scope["path"]`` avoids building a URL object just for the lookup.
+        path = request.scope["path"]
+        if token and path not in _OPEN_PATHS:
+            provided = _raw_authorization(request.scope)
+            if not provided or not _authorization_matches(provided, token):
                 reason = "missing" if not provided else "mismatched"
                 logger.warning(
                     "Rejected unauthorized request for %s from %s (%s bearer token)",
-                    request.url.path,
+                    path,
                     _client_identity(request),
                     reason,
                 )
@@ -680,9 +766,22 @@ app.mount("/api", mcp.streamable_http_app())
 app.mount("/sse", mcp.sse_app())
 
 
+# Held so the background warm-up is not garbage collected mid-flight.
+_WARM_POOL_TASK: asyncio.Task[None] | None = None
+
+
+async def _warm_pool_in_background() -> None:
+    # Each connection is a blocking handshake, so keep them off the loop.
+    warmed = await asyncio.to_thread(pool_module.warm_pool)
+    if warmed:
+        logger.info("Pre-warmed %s Vertica connection(s)", warmed)
+
+
 @app.on_event("startup")
 async def _startup_validation() -> None:
+    global _WARM_POOL_TASK
     global _SERVER_START_TIME
+    settings = get_settings()
     _SERVER_START_TIME = datetime.now(timezone.utc)
     logger.info(
         "Starting Vertica MCP targeting %s:%s/%s as %s",
@@ -709,3 +808,7 @@ async def _startup_validation() -> None:
         "Initial Vertica connectivity check succeeded in %sms",
         result.get("latency_ms", "?"),
     )
+
+    # Open the remaining pool connections in the background so the first
+    # requests do not pay for the handshake, without delaying startup.
+    _WARM_POOL_TASK = asyncio.create_task(_warm_pool_in_background())
@@ -10,7 +10,7 @@ from pathlib import Path
 from time import time
 from typing import Any, Iterable
 
-from .config import settings
+from .config import get_settings
 from .pool import get_conn
 
 
@@ -53,7 +53,7 @@ _SCHEMA_RE = re.compile(r"([A-Za-z_][A-Za-z0-9_]*)\.")
 def ensure_schema_allowed(schema: str) -> str:
     if not _IDENT.match(schema or ""):
         raise ValueError(f"Invalid identifier: {schema!r}")
-    if schema.lower() not in settings.allowed_schema_set():
+    if schema.lower() not in get_settings().allowed_schema_set():
         raise PermissionError(f"Schema not allowed: {schema}")
     return schema
 
@@ -63,16 +63,18 @@ def _find_schemas(sql_text: str) -> Iterable[str]:
 
 
 def _enforce_schema_allowlist(sql_text: str) -> None:
+    allowed = get_settings().allowed_schema_set()
     disallowed = [
         schema
         for schema in _find_schemas(sql_text)
-        if schema.lower() not in settings.allowed_schema_set()
+        if schema.lower() not in allowed
     ]
     if disallowed:
         raise PermissionError(f"Schemas not allowed: {sorted(disallowed)}")
 
 
 def run_sql(sql_name: str, params: dict[str, Any], limit: int | None = None):
+    settings = get_settings()
     path = SQL_DIR / sql_name
     if not path.exists():
         raise FileNotFoundError(f"SQL template not found: {path.name}")
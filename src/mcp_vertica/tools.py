@@ -9,13 +9,13 @@ from typing import Any
 from mcp.server.fastmcp import Context, FastMCP
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
-from .config import settings
+from .config import get_settings
 from .sqlman import Provenance, ensure_schema_allowed, ranked_multi, run_sql
 from .runtime import resolve_listen_host, resolve_listen_port
 
 
 def _schema_default() -> str:
-    return settings.default_schema
+    return get_settings().default_schema
 
 
 def _iso_z(value: datetime) -> str:
@@ -40,7 +40,17 @@ class SchemaBound(BaseModel):
 
 
 class Limited(SchemaBound):
-    limit: int = Field(default=25, ge=1, le=settings.max_rows)
+    limit: int = Field(default=25, ge=1)
+
+    @field_validator("limit")
+    @classmethod
+    def _validate_limit(cls, value: int) -> int:
+        # Checked per call rather than baked into the field so importing the
+        # tools does not have to build the settings.
+        max_rows = get_settings().max_rows
+        if value > max_rows:
+            raise ValueError(f"limit must be at most {max_rows}")
+        return value
 
 
 logger = logging.getLogger("mcp_vertica.tools")
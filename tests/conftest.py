@@ -38,12 +38,12 @@ def client(monkeypatch: pytest.MonkeyPatch) -> Generator[TestClient, None, None]
         lambda: {
             "ok": True,
             "latency_ms": 1.0,
-            "pool": {"configured_size": server.settings.pool_size},
+            "pool": {"configured_size": server.get_settings().pool_size},
             "target": {
-                "host": server.settings.host,
-                "port": server.settings.port,
-                "database": server.settings.database,
-                "user": server.settings.user,
+                "host": server.get_settings().host,
+                "port": server.get_settings().port,
+                "database": server.get_settings().database,
+                "user": server.get_settings().user,
             },
         },
     )
@@ -54,5 +54,7 @@ def client(monkeypatch: pytest.MonkeyPatch) -> Generator[TestClient, None, None]
         lambda timeout=2.0: {"ok": True, "ip": "203.0.113.10", "source": "test"},
     )
 
+    monkeypatch.setattr(server.pool_module, "warm_pool", lambda n=None: 0)
+
     with TestClient(server.app) as test_client:
         yield test_client
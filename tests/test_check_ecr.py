@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import importlib.util
+import io
+import json
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+
+def _load_check_ecr() -> object:
+    repo_root = Path(__file__).resolve().parents[1]
+    module_path = repo_root / "infra" / "check-ecr.py"
+    spec = importlib.util.spec_from_file_location("check_ecr", module_path)
+    if spec is None or spec.loader is None:
+        raise RuntimeError("Failed to load check-ecr module")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+check_ecr = _load_check_ecr()
+
+
+def _run_main(monkeypatch: pytest.MonkeyPatch, result: SimpleNamespace) -> dict[str, str]:
+    calls: list[list[str]] = []
+
+    def fake_run(args, **kwargs):
+        calls.append(args)
+        return result
+
+    stdin = io.TextIOWrapper(io.BytesIO(json.dumps({"name": "repo", "region": "us-east-1"}).encode()))
+    stdout = io.TextIOWrapper(io.BytesIO())
+    monkeypatch.setattr(check_ecr, "boto3", None)
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    monkeypatch.setattr(sys, "stdin", stdin)
+    monkeypatch.setattr(sys, "stdout", stdout)
+
+    check_ecr.main()
+
+    assert calls and calls[0][1:] == [
+        "ecr",
+        "describe-repositories",
+        "--repository-names",
+        "repo",
+        "--region",
+        "us-east-1",
+    ]
+    stdout.flush()
+    return json.loads(stdout.buffer.getvalue())
+
+
+def test_existing_repository_is_reported(monkeypatch: pytest.MonkeyPatch) -> None:
+    description = {"repositories": [{"repositoryUri": "123.dkr.ecr/repo", "registryId": "123"}]}
+    result = SimpleNamespace(returncode=0, stdout=json.dumps(description).encode(), stderr=b"")
+
+    payload = _run_main(monkeypatch, result)
+
+    assert payload == {
+        "exists": "true",
+        "repository_url": "123.dkr.ecr/repo",
+        "registry_id": "123",
+    }
+
+
+def test_missing_repository_is_not_an_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    result = SimpleNamespace(
+        returncode=254,
+        stdout=b"",
+        stderr=b"An error occurred (RepositoryNotFoundException) when calling ...",
+    )
+
+    payload = _run_main(monkeypatch, result)
+
+    assert payload == {"exists": "false"}
@@ -1,5 +1,6 @@
 import importlib.util
 import json
+import os
 from pathlib import Path
 import sys
 
@@ -7,6 +8,9 @@ import pytest
 
 
 MODULE_PATH = Path(__file__).resolve().parents[1] / "infra" / "claude_config.py"
+# The infra scripts import their siblings the way they do when run by path.
+if str(MODULE_PATH.parent) not in sys.path:
+    sys.path.insert(0, str(MODULE_PATH.parent))
 SPEC = importlib.util.spec_from_file_location("claude_config", MODULE_PATH)
 assert SPEC and SPEC.loader  # pragma: no cover - guard for missing module
 claude_config = importlib.util.module_from_spec(SPEC)
@@ -79,6 +83,38 @@ def test_write_claude_config(tmp_path: Path):
     assert "vertica-mcp" in data["mcpServers"]
 
 
+def test_write_claude_config_output_is_key_sorted(tmp_path: Path):
+    output = tmp_path / "claude.json"
+    claude_config.write_claude_config(SAMPLE_METADATA, output)
+
+    data = json.loads(output.read_text())
+    assert output.read_text() == json.dumps(data, indent=2, sort_keys=True) + "\n"
+
+
+def test_write_claude_config_escapes_non_ascii_like_json_dumps(tmp_path: Path):
+    metadata = {
+        **SAMPLE_METADATA,
+        "database": {**SAMPLE_METADATA["database"], "name": "caf\u00e9"},
+    }
+    output = tmp_path / "claude.json"
+    claude_config.write_claude_config(metadata, output)
+
+    raw = output.read_bytes()
+    data = json.loads(raw)
+    assert raw == (json.dumps(data, indent=2, sort_keys=True) + "\n").encode("ascii")
+    assert b"caf\\u00e9" in raw
+
+
+def test_write_claude_config_skips_unchanged_output(tmp_path: Path):
+    output = tmp_path / "claude.json"
+    claude_config.write_claude_config(SAMPLE_METADATA, output)
+    os.utime(output, (0, 0))
+
+    claude_config.write_claude_config(SAMPLE_METADATA, output)
+
+    assert output.stat().st_mtime == 0
+
+
 def test_cli_round_trip(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
     a2a_path = tmp_path / "mcp-a2a.json"
     output_path = tmp_path / "claude-config.json"
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import importlib
+import os
+import subprocess
+import sys
+from pathlib import Path
 
 import pytest
 
@@ -95,12 +99,14 @@ def test_debug_flags_and_retries(monkeypatch):
     _minimal_required_env(monkeypatch)
     monkeypatch.setenv("DB_CONNECTION_RETRIES", "5")
     monkeypatch.setenv("DB_CONNECTION_RETRY_BACKOFF_S", "1.25")
+    monkeypatch.setenv("DB_CONNECTION_RETRY_MAX_S", "10")
     monkeypatch.setenv("DB_DEBUG", "true")
 
     fresh = config.Settings()
 
     assert fresh.connection_attempts == 5
     assert fresh.connection_retry_backoff_s == 1.25
+    assert fresh.connection_retry_max_s == 10.0
     assert fresh.db_debug_logging is True
 
 
@@ -108,17 +114,23 @@ def test_invalid_retry_values_raise(monkeypatch):
     _minimal_required_env(monkeypatch)
     monkeypatch.setenv("DB_CONNECTION_RETRIES", "0")
 
-    with pytest.raises(config.ValidationError):
+    with pytest.raises(config.SettingsError):
         config.Settings()
 
     monkeypatch.setenv("DB_CONNECTION_RETRIES", "2")
     monkeypatch.setenv("DB_CONNECTION_RETRY_BACKOFF_S", "-1")
 
-    with pytest.raises(config.ValidationError):
+    with pytest.raises(config.SettingsError):
         config.Settings()
 
+    monkeypatch.setenv("DB_CONNECTION_RETRY_BACKOFF_S", "0.5")
+    monkeypatch.setenv("DB_CONNECTION_RETRY_MAX_S", "-1")
 
-def test_config_import_requires_dotenv(monkeypatch):
+    with pytest.raises(config.SettingsError):
+        config.Settings()
+
+
+def test_settings_require_dotenv(monkeypatch):
     original = env_module.ensure_dotenv
 
     def missing_dotenv():
@@ -126,8 +138,11 @@ def test_config_import_requires_dotenv(monkeypatch):
 
     monkeypatch.setattr(env_module, "ensure_dotenv", missing_dotenv)
 
+    # Importing the module no longer touches the .env file; resolving the
+    # settings does.
+    importlib.reload(config)
     with pytest.raises(FileNotFoundError):
-        importlib.reload(config)
+        config.get_settings()
 
     # Restore the original loader so later tests re-import configuration safely.
     monkeypatch.setattr(env_module, "ensure_dotenv", original)
@@ -159,6 +174,28 @@ def test_database_overrides_update_settings(monkeypatch):
     assert fresh.using_placeholder_credentials() is False
 
 
+def test_database_overrides_leave_other_settings_untouched(monkeypatch):
+    _minimal_required_env(monkeypatch)
+    monkeypatch.setenv("POOL_SIZE", "4")
+    fresh = config.Settings()
+
+    # Overrides must only assign the database fields, not rebuild settings
+    # from the (since changed) environment.
+    monkeypatch.setenv("POOL_SIZE", "12")
+    fresh.apply_database_overrides(
+        config.DatabaseOverrides(
+            host="runtime.example.com",
+            port=6000,
+            user="runtime",
+            password="override",
+            database="runtime",
+        )
+    )
+
+    assert fresh.pool_size == 4
+    assert fresh.allowed_schemas == ["public"]
+
+
 def test_reload_from_environment_restores_source(monkeypatch):
     _minimal_required_env(monkeypatch)
     fresh = config.Settings()
@@ -181,3 +218,102 @@ def test_reload_from_environment_restores_source(monkeypatch):
     assert fresh.password == "super-secret"
     assert fresh.database == "VMart"
     assert fresh.database_source == "environment"
+
+
+def test_backup_nodes_parse_hosts_and_default_port(monkeypatch):
+    _minimal_required_env(monkeypatch)
+    monkeypatch.setenv("DB_BACKUP_NODES", " node-a:5444 , node-b ,, node-c : 6000,")
+
+    fresh = config.Settings()
+
+    assert fresh.backup_nodes == [
+        ("node-a", 5444),
+        ("node-b", config.DEFAULT_DB_PORT),
+        ("node-c", 6000),
+    ]
+
+
+def test_backup_nodes_accept_ports_int_accepts(monkeypatch):
+    _minimal_required_env(monkeypatch)
+    monkeypatch.setenv("DB_BACKUP_NODES", "node-a:+5444,node-b:5_433")
+
+    fresh = config.Settings()
+
+    assert fresh.backup_nodes == [("node-a", 5444), ("node-b", 5433)]
+
+
+def test_backup_nodes_report_every_invalid_entry(monkeypatch):
+    _minimal_required_env(monkeypatch)
+    monkeypatch.setenv("DB_BACKUP_NODES", "ok:5433,:5433,node-b:,node-c:99999")
+
+    with pytest.raises(config.SettingsError) as excinfo:
+        config.Settings()
+
+    message = str(excinfo.value)
+    assert "':5433'" in message
+    assert "'node-b:'" in message
+    assert "'node-c:99999'" in message
+    assert "'ok:5433'" not in message
+
+
+def test_settings_are_resolved_lazily_and_shared():
+    assert "settings" not in vars(config)
+    assert config.settings is config.get_settings()
+
+
+def test_importing_service_modules_does_not_build_settings():
+    code = (
+        "import mcp_vertica.server, mcp_vertica.tools, mcp_vertica.sqlman\n"
+        "from mcp_vertica import config, env\n"
+        "assert config.get_settings.cache_info().currsize == 0\n"
+        "assert not env._DOTENV_LOADED\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(Path(config.__file__).parents[1])},
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_allowed_schema_set_is_cached_until_schemas_change(monkeypatch):
+    _minimal_required_env(monkeypatch)
+    monkeypatch.setenv("ALLOWED_SCHEMAS", "Public,Sales")
+    fresh = config.Settings()
+
+    first = fresh.allowed_schema_set()
+    assert first == {"public", "sales"}
+    assert fresh.allowed_schema_set() is first
+
+    fresh.allowed_schemas = ["Finance"]
+    assert fresh.allowed_schema_set() == {"finance"}
+
+
+def test_connection_options_are_cached_until_database_changes(monkeypatch):
+    _minimal_required_env(monkeypatch)
+    monkeypatch.setenv("DB_TLSMODE", "require")
+    fresh = config.Settings()
+
+    options = fresh.vertica_connection_options()
+    assert options["host"] == "vertica.example.com"
+    assert options["tlsmode"] == "require"
+    assert fresh.vertica_connection_options() is options
+    with pytest.raises(TypeError):
+        options["host"] = "elsewhere"  # type: ignore[index]
+
+    fresh.apply_database_overrides(
+        config.DatabaseOverrides(
+            host="runtime.example.com",
+            port=6000,
+            user="runtime",
+            password="override",
+            database="runtime",
+        )
+    )
+
+    refreshed = fresh.vertica_connection_options()
+    assert refreshed is not options
+    assert refreshed["host"] == "runtime.example.com"
+    assert refreshed["port"] == 6000
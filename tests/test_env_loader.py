@@ -37,6 +37,7 @@ def test_ensure_dotenv_errors_when_load_fails(reload_env_module, monkeypatch: py
     module = reload_env_module
 
     monkeypatch.setattr(Path, "exists", lambda self: True, raising=False)
+    monkeypatch.setattr(module, "_load_simple_env", lambda path: None)
     monkeypatch.setattr(module, "load_dotenv", lambda path: False, raising=False)
 
     with pytest.raises(RuntimeError) as exc:
@@ -45,6 +46,45 @@ def test_ensure_dotenv_errors_when_load_fails(reload_env_module, monkeypatch: py
     assert "Failed to load environment variables" in str(exc.value)
 
 
+def test_simple_env_files_skip_python_dotenv(reload_env_module, monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    module = reload_env_module
+    env_file = tmp_path / ".env"
+    env_file.write_text("# comment\nMCP_SIMPLE_A = one\nMCP_SIMPLE_B=already\n")
+    monkeypatch.setenv("MCP_SIMPLE_B", "kept")
+    monkeypatch.delenv("MCP_SIMPLE_A", raising=False)
+    monkeypatch.setattr(module, "_candidate_paths", lambda: [env_file])
+
+    def unexpected(path):  # pragma: no cover - failure path
+        raise AssertionError("python-dotenv should not be needed")
+
+    monkeypatch.setattr(module, "load_dotenv", unexpected, raising=False)
+
+    module.ensure_dotenv()
+
+    assert module.os.environ["MCP_SIMPLE_A"] == "one"
+    assert module.os.environ["MCP_SIMPLE_B"] == "kept"
+    monkeypatch.delenv("MCP_SIMPLE_A")
+
+
+def test_simple_env_files_strip_byte_order_mark(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("\ufeffMCP_BOM_KEY=value\n", encoding="utf-8")
+    monkeypatch.delenv("MCP_BOM_KEY", raising=False)
+    monkeypatch.delenv("\ufeffMCP_BOM_KEY", raising=False)
+
+    assert env_module._load_simple_env(env_file) is True
+    assert env_module.os.environ["MCP_BOM_KEY"] == "value"
+    assert "\ufeffMCP_BOM_KEY" not in env_module.os.environ
+    monkeypatch.delenv("MCP_BOM_KEY")
+
+
+def test_quoted_env_files_fall_back_to_python_dotenv(tmp_path: Path):
+    env_file = tmp_path / ".env"
+    env_file.write_text('MCP_QUOTED="value # not a comment"\n')
+
+    assert env_module._load_simple_env(env_file) is None
+
+
 def test_candidate_paths_respect_environment(monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setenv("VERTICA_MCP_ENV_FILE", "~/secrets/.env.mcp")
     monkeypatch.setenv("MCP_ENV_FILE", "~/ignored.env")
@@ -54,3 +94,22 @@ def test_candidate_paths_respect_environment(monkeypatch: pytest.MonkeyPatch):
     # The override should be expanded and appear before the repository default
     assert Path("~/secrets/.env.mcp").expanduser() == candidates[0]
     assert candidates[-1].name == ".env"
+
+
+def test_ensure_dotenv_loads_file_once(reload_env_module, monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    module = reload_env_module
+    env_file = tmp_path / ".env"
+    env_file.write_text("MCP_TEST_ONLY=1\n")
+    calls: list[Path] = []
+
+    def fake_load(path):
+        calls.append(path)
+        return True
+
+    monkeypatch.setattr(module, "_candidate_paths", lambda: [env_file])
+    monkeypatch.setattr(module, "_load_simple_env", fake_load)
+
+    module.ensure_dotenv()
+    module.ensure_dotenv()
+
+    assert calls == [env_file]
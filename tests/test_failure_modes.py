@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import importlib
+import io
+import threading
 from urllib.error import URLError
 
 import pytest
@@ -35,8 +37,8 @@ def test_health_response_failed_db_connection_includes_recent_errors(monkeypatch
     logging_utils.clear_error_history()
 
 
-def test_config_import_errors_without_env_file(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Importing configuration should fail loudly when the .env file is missing."""
+def test_settings_error_without_env_file(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Resolving configuration should fail loudly when the .env file is missing."""
 
     import mcp_vertica.config as config_module
     import mcp_vertica.env as env_module
@@ -47,8 +49,9 @@ def test_config_import_errors_without_env_file(monkeypatch: pytest.MonkeyPatch)
     monkeypatch.setattr(config_module, "ensure_dotenv", fake_ensure)
     monkeypatch.setattr(env_module, "ensure_dotenv", fake_ensure)
 
+    reloaded = importlib.reload(config_module)
     with pytest.raises(FileNotFoundError):
-        importlib.reload(config_module)
+        reloaded.get_settings()
 
     monkeypatch.undo()
     importlib.reload(env_module)
@@ -68,7 +71,7 @@ def test_database_check_reports_placeholder_credentials(monkeypatch: pytest.Monk
     """Placeholder credentials must force the database check to fail."""
 
     monkeypatch.setattr(
-        server.settings.__class__,
+        server.get_settings().__class__,
         "using_placeholder_credentials",
         lambda self: True,
     )
@@ -87,12 +90,41 @@ def test_external_ip_info_handles_unreachable_providers(monkeypatch: pytest.Monk
         raise URLError("offline")
 
     monkeypatch.setattr(runtime, "urlopen", offline_urlopen)
+    monkeypatch.setattr(runtime, "_EXTERNAL_IP_CACHE", None)
 
     result = runtime.external_ip_info(timeout=0.01)
 
     assert result["ok"] is False
     assert result["errors"]
     assert result["errors"][0]["exception"] == "URLError"
+    assert runtime._EXTERNAL_IP_CACHE is None
+
+
+def test_external_ip_info_uses_first_answer_and_caches_it(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A hanging provider must not delay the answer, which is then reused."""
+
+    release = threading.Event()
+    calls: list[str] = []
+
+    def fake_urlopen(url: str, timeout: float):
+        calls.append(url)
+        if "ipify" in url:
+            release.wait(timeout=5)
+            raise URLError("slow")
+        return io.BytesIO(b'{"ip": "198.51.100.7"}')
+
+    monkeypatch.delenv("EXTERNAL_IP", raising=False)
+    monkeypatch.setattr(runtime, "urlopen", fake_urlopen)
+    monkeypatch.setattr(runtime, "_EXTERNAL_IP_CACHE", None)
+
+    try:
+        result = runtime.external_ip_info(timeout=5)
+        assert result == {"ok": True, "ip": "198.51.100.7", "source": "https://ifconfig.co/json"}
+
+        assert runtime.external_ip_info(timeout=5) == result
+        assert len(calls) == 2
+    finally:
+        release.set()
 
 
 def test_health_response_skips_vertica_when_not_requested(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
+from decimal import Decimal
 
+import pytest
 from fastapi.testclient import TestClient
 
 from mcp_vertica import server
@@ -38,14 +40,14 @@ def test_configure_database_endpoint_updates_settings(monkeypatch, client):
         assert database["placeholder_credentials"] is False
         assert "password" not in database
 
-        assert server.settings.host == payload["host"]
-        assert server.settings.port == payload["port"]
-        assert server.settings.user == payload["user"]
-        assert server.settings.password == payload["password"]
-        assert server.settings.database == payload["database"]
+        assert server.get_settings().host == payload["host"]
+        assert server.get_settings().port == payload["port"]
+        assert server.get_settings().user == payload["user"]
+        assert server.get_settings().password == payload["password"]
+        assert server.get_settings().database == payload["database"]
         assert calls["reset"] == 1
     finally:
-        server.settings.reload_from_environment()
+        server.get_settings().reload_from_environment()
 
 
 def test_diagnostics_endpoint(client):
@@ -59,7 +61,7 @@ def test_diagnostics_endpoint(client):
 
 def test_dbs_endpoint_lists_configured_databases(monkeypatch):
     backup_nodes = [("backup.vertica.example.com", 5434)]
-    monkeypatch.setattr(server.settings, "backup_nodes", backup_nodes)
+    monkeypatch.setattr(server.get_settings(), "backup_nodes", backup_nodes)
 
     with _bootstrap_test_client(monkeypatch) as test_client:
         response = test_client.get("/dbs")
@@ -67,9 +69,9 @@ def test_dbs_endpoint_lists_configured_databases(monkeypatch):
     assert response.status_code == 200
 
     payload = response.json()
-    assert payload["current"]["host"] == server.settings.host
-    assert payload["current"]["database"] == server.settings.database
-    assert payload["current"]["user"] == server.settings.user
+    assert payload["current"]["host"] == server.get_settings().host
+    assert payload["current"]["database"] == server.get_settings().database
+    assert payload["current"]["user"] == server.get_settings().user
 
     supported = payload["supported"]
     assert any(entry["role"] == "primary" for entry in supported)
@@ -79,15 +81,15 @@ def test_dbs_endpoint_lists_configured_databases(monkeypatch):
             "role": "backup",
             "host": backup_nodes[0][0],
             "port": backup_nodes[0][1],
-            "database": server.settings.database,
-            "user": server.settings.user,
+            "database": server.get_settings().database,
+            "user": server.get_settings().user,
         }
     ]
     for entry in supported:
         assert "password" not in entry
 
     pool = payload["pool"]
-    assert pool["configured_size"] == server.settings.pool_size
+    assert pool["configured_size"] == server.get_settings().pool_size
 
 
 def test_root_endpoint_provides_links(client):
@@ -123,11 +125,14 @@ def test_query_endpoint_executes_select(monkeypatch, client):
     events = {"executed": None, "cursor_closed": False}
 
     class DummyCursor:
+        def __init__(self) -> None:
+            self._pending = [[(1,)]]
+
         def execute(self, query: str) -> None:  # pragma: no cover - trivial
             events["executed"] = query
 
-        def fetchall(self):  # pragma: no cover - trivial
-            return [(1,)]
+        def fetchmany(self, size: int):  # pragma: no cover - trivial
+            return self._pending.pop() if self._pending else []
 
         def close(self) -> None:  # pragma: no cover - trivial
             events["cursor_closed"] = True
@@ -153,6 +158,53 @@ def test_query_endpoint_executes_select(monkeypatch, client):
     assert events["cursor_closed"] is True
 
 
+def test_query_endpoint_renders_integers_beyond_64_bits(monkeypatch, client):
+    big = Decimal("123456789012345678901234567890")
+
+    class DummyCursor:
+        def __init__(self) -> None:
+            self._pending = [[(big,)]]
+
+        def execute(self, query: str) -> None:
+            pass
+
+        def fetchmany(self, size: int):
+            return self._pending.pop() if self._pending else []
+
+        def close(self) -> None:
+            pass
+
+    class DummyConn:
+        def cursor(self) -> DummyCursor:
+            return DummyCursor()
+
+    @contextmanager
+    def fake_get_conn():
+        yield DummyConn()
+
+    monkeypatch.setattr(server.pool_module, "get_conn", fake_get_conn)
+
+    response = client.post("/query", json={"query": "SELECT 1"})
+    assert response.status_code == 200
+    assert response.json()["rows"] == [[int(big)]]
+
+
+def test_fetch_rows_drains_batches():
+    class BatchCursor:
+        def __init__(self) -> None:
+            self.sizes: list[int] = []
+            self._batches = [[[3, 4]], [(1, 2), "raw"]]
+
+        def fetchmany(self, size: int):
+            self.sizes.append(size)
+            return self._batches.pop() if self._batches else []
+
+    cursor = BatchCursor()
+
+    assert server._fetch_rows(cursor) == [(1, 2), "raw", [3, 4]]
+    assert cursor.sizes == [server._FETCH_BATCH_ROWS] * 3
+
+
 def test_query_endpoint_rejects_non_select(client):
     response = client.post("/query", json={"query": "UPDATE foo SET bar = 1"})
     assert response.status_code == 200
@@ -162,6 +214,13 @@ def test_query_endpoint_rejects_non_select(client):
     assert payload["error"] == "Only SELECT statements are allowed"
 
 
+@pytest.mark.parametrize("query", ["SELECT", "selectx 1", "  SELEC  "])
+def test_query_execution_requires_select_prefix(query):
+    result = server._query_execution(query)
+
+    assert result == {"ok": False, "error": "Only SELECT statements are allowed"}
+
+
 def test_query_endpoint_reports_errors(monkeypatch, client):
     @contextmanager
     def fake_get_conn():
@@ -179,8 +238,38 @@ def test_query_endpoint_reports_errors(monkeypatch, client):
     assert payload["exception"] == "RuntimeError"
 
 
+def test_query_failure_closes_cursor_once_before_release(monkeypatch):
+    events: list[str] = []
+
+    class FailingCursor:
+        def execute(self, query: str) -> None:
+            raise RuntimeError("bad query")
+
+        def close(self) -> None:
+            events.append("cursor_closed")
+
+    class DummyConn:
+        def cursor(self) -> FailingCursor:
+            return FailingCursor()
+
+    @contextmanager
+    def fake_get_conn():
+        try:
+            yield DummyConn()
+        finally:
+            events.append("released")
+
+    monkeypatch.setattr(server.pool_module, "get_conn", fake_get_conn)
+
+    result = server._query_execution("SELECT 1")
+
+    assert result["ok"] is False
+    assert result["error"] == "bad query"
+    assert events == ["cursor_closed", "released"]
+
+
 def test_bearer_middleware_logs_auth_failures(monkeypatch, caplog):
-    monkeypatch.setattr(server.settings, "http_token", "expected")
+    monkeypatch.setattr(server.get_settings(), "http_token", "expected")
 
     with _bootstrap_test_client(monkeypatch) as test_client:
         caplog.set_level("WARNING")
@@ -197,6 +286,19 @@ def test_bearer_middleware_logs_auth_failures(monkeypatch, caplog):
     assert "(missing bearer token)" in messages[0]
 
 
+def test_bearer_middleware_checks_token_value(monkeypatch, caplog):
+    monkeypatch.setattr(server.get_settings(), "http_token", "expected")
+
+    with _bootstrap_test_client(monkeypatch) as test_client:
+        caplog.set_level("WARNING")
+        rejected = test_client.get("/diagnostics", headers={"Authorization": "Bearer expecte"})
+        accepted = test_client.get("/diagnostics", headers={"Authorization": "Bearer expected"})
+
+    assert rejected.status_code == 401
+    assert "(mismatched bearer token)" in caplog.text
+    assert accepted.status_code == 200
+
+
 def _bootstrap_test_client(monkeypatch):
     monkeypatch.setattr(
         server,
@@ -204,12 +306,12 @@ def _bootstrap_test_client(monkeypatch):
         lambda: {
             "ok": True,
             "latency_ms": 1.0,
-            "pool": {"configured_size": server.settings.pool_size},
+            "pool": {"configured_size": server.get_settings().pool_size},
             "target": {
-                "host": server.settings.host,
-                "port": server.settings.port,
-                "database": server.settings.database,
-                "user": server.settings.user,
+                "host": server.get_settings().host,
+                "port": server.get_settings().port,
+                "database": server.get_settings().database,
+                "user": server.get_settings().user,
             },
         },
     )
@@ -220,4 +322,6 @@ def _bootstrap_test_client(monkeypatch):
         lambda timeout=2.0: {"ok": True, "ip": "203.0.113.10", "source": "test"},
     )
 
+    monkeypatch.setattr(server.pool_module, "warm_pool", lambda n=None: 0)
+
     return TestClient(server.app, raise_server_exceptions=False)
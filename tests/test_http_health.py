@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import threading
 from contextlib import contextmanager
 
 import pytest
@@ -19,12 +20,12 @@ def test_health_endpoint(monkeypatch, client):
         lambda: {
             "ok": True,
             "latency_ms": 1.23,
-            "pool": {"configured_size": server.settings.pool_size},
+            "pool": {"configured_size": server.get_settings().pool_size},
             "target": {
-                "host": server.settings.host,
-                "port": server.settings.port,
-                "database": server.settings.database,
-                "user": server.settings.user,
+                "host": server.get_settings().host,
+                "port": server.get_settings().port,
+                "database": server.get_settings().database,
+                "user": server.get_settings().user,
             },
         },
     )
@@ -41,9 +42,9 @@ def test_health_endpoint(monkeypatch, client):
     assert runtime_status["listen"]["host"]
     assert runtime_status["external_ip"]["ip"] == "203.0.113.10"
     config = payload["diagnostics"]["config"]
-    assert config["database"]["host"] == server.settings.host
-    assert config["auth"]["http_token_configured"] is bool(server.settings.http_token)
-    assert config["database"]["source"] == server.settings.database_source
+    assert config["database"]["host"] == server.get_settings().host
+    assert config["auth"]["http_token_configured"] is bool(server.get_settings().http_token)
+    assert config["database"]["source"] == server.get_settings().database_source
     assert config["database"]["placeholder_credentials"] is False
 
 
@@ -74,7 +75,7 @@ def test_health_endpoint_reports_failures(monkeypatch, client):
 
 def test_health_endpoint_reports_placeholder_credentials(monkeypatch):
     monkeypatch.setattr(
-        server.settings.__class__,
+        server.get_settings().__class__,
         "using_placeholder_credentials",
         lambda self: True,
     )
@@ -137,7 +138,7 @@ def test_database_check_success(monkeypatch):
 
     class DummyQueue:
         def __init__(self) -> None:  # pragma: no cover - trivial
-            self.maxsize = server.settings.pool_size
+            self.maxsize = server.get_settings().pool_size
 
         def qsize(self) -> int:  # pragma: no cover - trivial
             return 2
@@ -147,14 +148,25 @@ def test_database_check_success(monkeypatch):
 
     result = server._database_check()
     assert result["ok"] is True
-    assert result["pool"]["configured_size"] == server.settings.pool_size
+    assert result["pool"]["configured_size"] == server.get_settings().pool_size
     assert result["pool"]["available"] == 2
-    assert result["pool"]["max_size"] == server.settings.pool_size
+    assert result["pool"]["max_size"] == server.get_settings().pool_size
     assert "recovery" in result["pool"]
-    assert result["target"]["database"] == server.settings.database
+    assert result["target"]["database"] == server.get_settings().database
     assert events["cursor_closed"] is True
 
 
+def test_pool_details_do_not_build_the_pool(monkeypatch):
+    monkeypatch.setattr(server.pool_module, "_POOL", None)
+
+    details = server._pool_details()
+
+    assert server.pool_module._POOL is None
+    assert details["available"] == 0
+    assert details["max_size"] == server.get_settings().pool_size
+    assert "recovery" in details
+
+
 def test_database_check_failure(monkeypatch):
     @contextmanager
     def fake_get_conn():
@@ -171,7 +183,7 @@ def test_database_check_failure(monkeypatch):
 
 
 def test_protected_routes_require_bearer_token(monkeypatch, client):
-    monkeypatch.setattr(server.settings, "http_token", "shhh", raising=False)
+    monkeypatch.setattr(server.get_settings(), "http_token", "shhh", raising=False)
 
     def make_request(path: str, headers: list[tuple[bytes, bytes]] | None = None) -> Request:
         async def receive() -> dict:
@@ -248,6 +260,11 @@ def test_startup_allows_vertica_failures(monkeypatch):
         lambda timeout=2.0: {"ok": False, "errors": []},
     )
 
+    def unexpected_warm(n=None):  # pragma: no cover - guard against invocation
+        raise AssertionError("pool warmed despite failed connectivity check")
+
+    monkeypatch.setattr(server.pool_module, "warm_pool", unexpected_warm)
+
     with TestClient(server.app) as degraded_client:
         # Startup should have attempted the connectivity probe once.
         assert attempts["count"] == 1
@@ -259,3 +276,28 @@ def test_startup_allows_vertica_failures(monkeypatch):
         # Without ping-vertica the health endpoint remains optimistic.
         assert payload["ok"] is True
         assert payload["checks"]["database"]["skipped"] is True
+
+
+def test_startup_warms_pool_after_successful_check(monkeypatch):
+    warmed: list[int | None] = []
+    done = threading.Event()
+    on_loop: list[bool] = []
+
+    def fake_warm(n=None):
+        warmed.append(n)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            on_loop.append(False)
+        else:  # pragma: no cover - failure path
+            on_loop.append(True)
+        done.set()
+        return 2
+
+    monkeypatch.setattr(server, "_database_check", lambda: {"ok": True, "latency_ms": 1.0})
+    monkeypatch.setattr(server.pool_module, "warm_pool", fake_warm)
+
+    with TestClient(server.app):
+        assert done.wait(timeout=5)
+        assert warmed == [None]
+        assert on_loop == [False]
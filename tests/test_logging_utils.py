@@ -40,3 +40,104 @@ def test_record_service_error_tracks_entries(monkeypatch):
     assert errors
     assert errors[-1]["message"] == "test error"
     assert errors[-1]["source"] == "database"
+
+
+def test_record_service_error_emits_github_annotation(monkeypatch, capsys):
+    monkeypatch.setenv("GITHUB_ACTIONS", "true")
+    logging_utils.configure_logging(force=True)
+    monkeypatch.delenv("GITHUB_ACTIONS")
+
+    try:
+        logging_utils.record_service_error(
+            source="database", message="boom", exception=RuntimeError("down")
+        )
+    finally:
+        logging_utils.configure_logging(force=True)
+        logging_utils.clear_error_history()
+
+    assert "::error title=database::boom (RuntimeError: down)" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("raw, expected", [(None, 50), ("5", 5), ("0", 1), ("bogus", 50)])
+def test_error_history_limit_from_env(monkeypatch, raw, expected):
+    if raw is None:
+        monkeypatch.delenv("MCP_ERROR_HISTORY_LIMIT", raising=False)
+    else:
+        monkeypatch.setenv("MCP_ERROR_HISTORY_LIMIT", raw)
+
+    assert logging_utils._parse_int_env("MCP_ERROR_HISTORY_LIMIT", 50, minimum=1) == expected
+
+
+def test_recent_errors_render_timestamps_on_read():
+    logging_utils.clear_error_history()
+    try:
+        for index in range(3):
+            logging_utils.record_service_error(source="database", message=f"error {index}")
+
+        latest = logging_utils.recent_errors(limit=2)
+    finally:
+        logging_utils.clear_error_history()
+
+    assert [entry["message"] for entry in latest] == ["error 1", "error 2"]
+    assert list(latest[0]) == ["timestamp", "source", "message"]
+    assert latest[0]["timestamp"].endswith("+00:00")
+
+
+def test_recent_errors_return_plain_context_dicts():
+    logging_utils.clear_error_history()
+    try:
+        entry = logging_utils.record_service_error(
+            source="database",
+            message="boom",
+            context={"phase": "health"},
+            copy_context=False,
+        )
+        with pytest.raises(TypeError):
+            entry["context"]["phase"] = "mutated"  # type: ignore[index]
+
+        rendered = logging_utils.recent_errors()[-1]
+    finally:
+        logging_utils.clear_error_history()
+
+    assert type(rendered["context"]) is dict
+    assert rendered["context"] == {"phase": "health"}
+
+
+def test_record_service_error_copies_context_by_default():
+    logging_utils.clear_error_history()
+    context = {"phase": "health"}
+    try:
+        logging_utils.record_service_error(
+            source="database", message="boom", context=context
+        )
+        context["phase"] = "mutated"
+
+        rendered = logging_utils.recent_errors()[-1]
+    finally:
+        logging_utils.clear_error_history()
+
+    assert rendered["context"] == {"phase": "health"}
+
+
+def test_configure_logging_reuses_root_handler(monkeypatch):
+    monkeypatch.setenv("DEBUG", "1")
+    logging_utils.configure_logging(force=True)
+    handler = logging_utils._HANDLER
+
+    monkeypatch.setenv("DEBUG", "2")
+    logging_utils.configure_logging(force=True)
+
+    root = logging.getLogger()
+    assert logging_utils._HANDLER is handler
+    assert root.handlers.count(handler) == 1
+    assert root.level == logging.DEBUG
+
+
+def test_invalid_debug_value_warns_every_time(caplog):
+    caplog.set_level(logging.WARNING, logger="mcp_vertica.logging")
+
+    for _ in range(2):
+        assert logging_utils._debug_level_from_env("verbose") == (logging.WARNING, 0)
+
+    warnings = [r for r in caplog.records if "Invalid DEBUG value" in r.getMessage()]
+    assert len(warnings) == 2
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import errno
 import socket
-from queue import Queue
+import threading
+import time
 
 import pytest
 
@@ -10,20 +11,28 @@ from mcp_vertica import pool
 
 
 class DummyConnection:
-    def close(self) -> None:  # pragma: no cover - nothing to close in tests
-        pass
+    def __init__(self) -> None:
+        self._closed = False
+
+    def close(self) -> None:
+        self._closed = True
+
+    def closed(self) -> bool:
+        return self._closed
 
 
 def _reset_pool(monkeypatch) -> None:
-    monkeypatch.setattr(pool, "_POOL", Queue(maxsize=1))
+    monkeypatch.setattr(pool, "_POOL", pool._ConnectionPool(maxsize=1))
     monkeypatch.setattr(pool, "_RETRY_STATE", pool._default_retry_state())
+    # Take the upper bound of the jittered backoff so sleeps are predictable.
+    monkeypatch.setattr(pool.random, "random", lambda: 1.0)
 
 
 def test_get_conn_retries_and_logs(monkeypatch, caplog):
     _reset_pool(monkeypatch)
-    monkeypatch.setattr(pool.settings, "connection_attempts", 2)
-    monkeypatch.setattr(pool.settings, "connection_retry_backoff_s", 0.5)
-    monkeypatch.setattr(pool.settings, "db_debug_logging", True)
+    monkeypatch.setattr(pool.get_settings(), "connection_attempts", 2)
+    monkeypatch.setattr(pool.get_settings(), "connection_retry_backoff_s", 0.5)
+    monkeypatch.setattr(pool.get_settings(), "db_debug_logging", True)
 
     attempts = {"count": 0}
 
@@ -66,11 +75,60 @@ def test_get_conn_retries_and_logs(monkeypatch, caplog):
     assert state["recovered_at"] is not None
 
 
+def test_first_attempt_success_leaves_retry_state_alone(monkeypatch):
+    _reset_pool(monkeypatch)
+    monkeypatch.setattr(pool.vertica_python, "connect", lambda **_kwargs: DummyConnection())
+    before = pool.connection_retry_state()
+
+    with pool.get_conn():
+        pass
+
+    assert pool.connection_retry_state() == before
+
+
+def test_success_after_exhaustion_records_recovery(monkeypatch):
+    _reset_pool(monkeypatch)
+    monkeypatch.setattr(
+        pool,
+        "_RETRY_STATE",
+        {**pool._default_retry_state(), "exhausted": True, "attempts": 3},
+    )
+    monkeypatch.setattr(pool.vertica_python, "connect", lambda **_kwargs: DummyConnection())
+
+    with pool.get_conn():
+        pass
+
+    state = pool.connection_retry_state()
+    assert state["exhausted"] is False
+    assert state["attempts"] == 1
+    assert state["recovered_at"] is not None
+
+
+def test_retry_state_snapshots_are_independent_copies(monkeypatch):
+    _reset_pool(monkeypatch)
+    monkeypatch.setattr(pool.get_settings(), "connection_attempts", 1)
+
+    def failing_connect(**_kwargs):
+        raise RuntimeError("down")
+
+    monkeypatch.setattr(pool.vertica_python, "connect", failing_connect)
+    before = pool.connection_retry_state()
+
+    with pytest.raises(RuntimeError):
+        with pool.get_conn():
+            pass
+
+    assert before["attempts"] == 0
+    assert pool.connection_retry_state()["attempts"] == 1
+    before["attempts"] = 5
+    assert pool.connection_retry_state()["attempts"] == 1
+
+
 def test_get_conn_raises_after_retry_exhaustion(monkeypatch, caplog):
     _reset_pool(monkeypatch)
-    monkeypatch.setattr(pool.settings, "connection_attempts", 2)
-    monkeypatch.setattr(pool.settings, "connection_retry_backoff_s", 0.0)
-    monkeypatch.setattr(pool.settings, "db_debug_logging", False)
+    monkeypatch.setattr(pool.get_settings(), "connection_attempts", 2)
+    monkeypatch.setattr(pool.get_settings(), "connection_retry_backoff_s", 0.0)
+    monkeypatch.setattr(pool.get_settings(), "db_debug_logging", False)
 
     def failing_connect(**_kwargs):
         raise RuntimeError("unreachable")
@@ -87,9 +145,9 @@ def test_get_conn_raises_after_retry_exhaustion(monkeypatch, caplog):
 
 def test_exponential_backoff_progression(monkeypatch, caplog):
     _reset_pool(monkeypatch)
-    monkeypatch.setattr(pool.settings, "connection_attempts", 3)
-    monkeypatch.setattr(pool.settings, "connection_retry_backoff_s", 0.25)
-    monkeypatch.setattr(pool.settings, "db_debug_logging", False)
+    monkeypatch.setattr(pool.get_settings(), "connection_attempts", 3)
+    monkeypatch.setattr(pool.get_settings(), "connection_retry_backoff_s", 0.25)
+    monkeypatch.setattr(pool.get_settings(), "db_debug_logging", False)
 
     def failing_connect(**_kwargs):
         raise RuntimeError("down")
@@ -120,11 +178,34 @@ def test_exponential_backoff_progression(monkeypatch, caplog):
     assert state["recovered_at"] is None
 
 
+def test_backoff_delay_uses_full_jitter(monkeypatch):
+    draws: list[float] = []
+
+    def fake_random() -> float:
+        draws.append(0.5)
+        return 0.5
+
+    monkeypatch.setattr(pool.random, "random", fake_random)
+
+    assert pool._exponential_backoff_delay(0.5, 3) == 1.0
+    assert pool._exponential_backoff_delay(1.0, 1000) == float(2**31) / 2
+    assert pool._exponential_backoff_delay(0.0, 3) == 0.0
+    assert len(draws) == 2
+
+
+def test_backoff_delay_respects_cap(monkeypatch):
+    monkeypatch.setattr(pool.random, "random", lambda: 1.0)
+
+    assert pool._exponential_backoff_delay(0.5, 10, 30.0) == 30.0
+    assert pool._exponential_backoff_delay(0.5, 2, 30.0) == 1.0
+    assert pool._exponential_backoff_delay(0.5, 10, 0.0) == 256.0
+
+
 def test_connection_failure_logs_redacted_credentials(monkeypatch, caplog):
     _reset_pool(monkeypatch)
-    monkeypatch.setattr(pool.settings, "connection_attempts", 1)
-    monkeypatch.setattr(pool.settings, "connection_retry_backoff_s", 0.0)
-    monkeypatch.setattr(pool.settings, "db_debug_logging", False)
+    monkeypatch.setattr(pool.get_settings(), "connection_attempts", 1)
+    monkeypatch.setattr(pool.get_settings(), "connection_retry_backoff_s", 0.0)
+    monkeypatch.setattr(pool.get_settings(), "db_debug_logging", False)
 
     def failing_connect(**_kwargs):
         raise RuntimeError("password=super-secret Authorization=Bearer 12345 token=abc")
@@ -141,6 +222,29 @@ def test_connection_failure_logs_redacted_credentials(monkeypatch, caplog):
     assert "12345" not in combined
     assert "token=abc" not in combined
     assert combined.count("<redacted>") >= 2
+    assert "Exhausted 1 attempts to establish Vertica connection to" in combined
+
+
+@pytest.mark.parametrize(
+    "text, secrets",
+    [
+        ('Bearer abc "password": "pw1"', ("abc", "pw1")),
+        ("password=pw2authorization: Bearer tk3", ("pw2", "tk3")),
+        ("{'token': 'tk4', 'host': 'db'}", ("tk4",)),
+    ],
+)
+def test_redaction_handles_overlapping_fragments(text, secrets):
+    redacted = pool._redact_sensitive_text(text)
+
+    for secret in secrets:
+        assert secret not in redacted
+    assert "<redacted>" in redacted
+
+
+def test_redaction_leaves_plain_text_untouched():
+    text = "connection refused by db.example.com:5433"
+
+    assert pool._redact_sensitive_text(text) is text
 
 
 @pytest.mark.parametrize(
@@ -168,8 +272,8 @@ def test_connection_failure_logs_redacted_credentials(monkeypatch, caplog):
 )
 def test_classified_connection_errors(monkeypatch, raised, expected_message):
     _reset_pool(monkeypatch)
-    monkeypatch.setattr(pool.settings, "connection_attempts", 1)
-    monkeypatch.setattr(pool.settings, "db_debug_logging", False)
+    monkeypatch.setattr(pool.get_settings(), "connection_attempts", 1)
+    monkeypatch.setattr(pool.get_settings(), "db_debug_logging", False)
 
     def failing_connect(**_kwargs):
         raise raised
@@ -183,6 +287,139 @@ def test_classified_connection_errors(monkeypatch, raised, expected_message):
     assert expected_message in str(excinfo.value)
 
 
+def test_get_conn_reuses_and_caps_idle_connections(monkeypatch):
+    _reset_pool(monkeypatch)
+    monkeypatch.setattr(pool.get_settings(), "connection_attempts", 1)
+
+    created: list[DummyConnection] = []
+
+    def connect(**_kwargs):
+        conn = DummyConnection()
+        created.append(conn)
+        return conn
+
+    monkeypatch.setattr(pool.vertica_python, "connect", connect)
+
+    with pool.get_conn() as first:
+        pass
+    with pool.get_conn() as second:
+        # Checked out concurrently with ``second`` so a new one is opened.
+        with pool.get_conn() as third:
+            pass
+
+    assert second is first
+    assert third is not first
+    assert len(created) == 2
+    # The pool holds one idle connection; returning ``second`` evicts the
+    # longer-idle ``third``.
+    assert pool._POOL.qsize() == 1
+    assert third.closed() is True
+    assert first.closed() is False
+
+
+def test_concurrent_first_use_builds_a_single_pool(monkeypatch):
+    monkeypatch.setattr(pool, "_POOL", None)
+    settings = pool.get_settings()
+    barrier = threading.Barrier(8)
+
+    def slow_settings():
+        # Widen the window between the unlocked check and the assignment.
+        time.sleep(0.01)
+        return settings
+
+    monkeypatch.setattr(pool, "get_settings", slow_settings)
+    built: list[pool._ConnectionPool] = []
+
+    def first_use() -> None:
+        barrier.wait()
+        built.append(pool._get_pool())
+
+    threads = [threading.Thread(target=first_use) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(built) == 8
+    assert all(candidate is pool._POOL for candidate in built)
+
+
+def test_reset_pool_closes_idle_connections(monkeypatch):
+    _reset_pool(monkeypatch)
+    idle = DummyConnection()
+    assert pool._POOL.give(idle) is None
+
+    pool.reset_pool()
+
+    assert idle.closed() is True
+    assert pool._POOL.qsize() == 0
+    assert pool._POOL.maxsize == pool.get_settings().pool_size
+
+
+def test_reset_pool_closes_every_drained_connection(monkeypatch):
+    monkeypatch.setattr(pool, "_POOL", pool._ConnectionPool(maxsize=3))
+    idle = [DummyConnection() for _ in range(3)]
+    for conn in idle:
+        assert pool._POOL.give(conn) is None
+
+    pool.reset_pool()
+
+    assert all(conn.closed() for conn in idle)
+    assert pool._POOL.qsize() == 0
+
+
+def test_get_conn_replaces_dead_and_idle_connections(monkeypatch):
+    monkeypatch.setattr(pool, "_POOL", pool._ConnectionPool(maxsize=2))
+    monkeypatch.setattr(pool.get_settings(), "connection_attempts", 1)
+    monkeypatch.setattr(pool.get_settings(), "pool_idle_timeout_s", 60.0)
+
+    dead = DummyConnection()
+    dead.close()
+    stale = DummyConnection()
+    pool._POOL.give(dead)
+    pool._POOL.give(stale)
+
+    clock = {"now": pool.time.monotonic() + 120.0}
+    monkeypatch.setattr(pool.time, "monotonic", lambda: clock["now"])
+
+    fresh = DummyConnection()
+    monkeypatch.setattr(pool.vertica_python, "connect", lambda **_kwargs: fresh)
+
+    with pool.get_conn() as conn:
+        assert conn is fresh
+        conn.close()
+
+    assert stale.closed() is True
+    # A connection closed while checked out is not returned to the pool.
+    assert pool._POOL.qsize() == 0
+
+
+def test_warm_pool_fills_to_capacity(monkeypatch):
+    monkeypatch.setattr(pool, "_POOL", pool._ConnectionPool(maxsize=2))
+    monkeypatch.setattr(pool.vertica_python, "connect", lambda **_kwargs: DummyConnection())
+
+    assert pool.warm_pool(5) == 2
+    assert pool._POOL.qsize() == 2
+    assert pool.warm_pool() == 0
+
+
+def test_warm_pool_stops_at_first_failure(monkeypatch, caplog):
+    _reset_pool(monkeypatch)
+    monkeypatch.setattr(pool, "_POOL", pool._ConnectionPool(maxsize=3))
+
+    def failing_connect(**_kwargs):
+        raise RuntimeError("password=hunter2 refused")
+
+    monkeypatch.setattr(pool.vertica_python, "connect", failing_connect)
+
+    caplog.set_level("WARNING")
+    assert pool.warm_pool() == 0
+    assert pool._POOL.qsize() == 0
+    assert "Stopped warming the Vertica pool" in caplog.text
+    assert "hunter2" not in caplog.text
+    assert pool.connection_retry_state()["attempts"] == 0
+
+
 def attempts_logged(caplog) -> bool:
     return any(
         "Failed to establish Vertica connection" in record.message
@@ -116,6 +116,39 @@ def test_run_server_falls_back_to_port_env(monkeypatch: pytest.MonkeyPatch, capl
     assert "non-integer LISTEN_PORT value" in caplog.text
 
 
+def test_listen_host_resolution_is_memoised_per_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(runtime, "_RESOLVED_HOSTS", {})
+    monkeypatch.setenv("LISTEN_HOST", "10.0.0.7")
+    checked: list[str] = []
+    original = runtime.is_bindable_listen_host
+
+    def counting_check(value: str, **kwargs: object) -> bool:
+        checked.append(value)
+        return original(value, **kwargs)
+
+    monkeypatch.setattr(runtime, "is_bindable_listen_host", counting_check)
+
+    assert runtime.resolve_listen_host() == "10.0.0.7"
+    assert runtime.resolve_listen_host() == "10.0.0.7"
+    assert checked == ["10.0.0.7"]
+
+    monkeypatch.setenv("LISTEN_HOST", "10.0.0.8")
+    assert runtime.resolve_listen_host() == "10.0.0.8"
+
+
+def test_invalid_listen_port_warns_on_every_resolution(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    monkeypatch.setattr(runtime, "_RESOLVED_PORTS", {})
+    monkeypatch.setenv("LISTEN_PORT", "not-a-number")
+
+    with caplog.at_level("WARNING"):
+        assert runtime.resolve_listen_port() == 8000
+        assert runtime.resolve_listen_port() == 8000
+
+    assert caplog.text.count("non-integer LISTEN_PORT value") == 2
+
+
 def test_main_defaults_to_http(monkeypatch: pytest.MonkeyPatch) -> None:
     captured = _fake_uvicorn(monkeypatch)
 
@@ -154,14 +187,14 @@ def test_main_applies_database_override_payload(monkeypatch: pytest.MonkeyPatch)
 
     try:
         server.main(["--database-payload", json.dumps(payload)])
-        assert server.settings.host == payload["host"]
-        assert server.settings.port == payload["port"]
-        assert server.settings.user == payload["user"]
-        assert server.settings.password == payload["password"]
-        assert server.settings.database == payload["database"]
+        assert server.get_settings().host == payload["host"]
+        assert server.get_settings().port == payload["port"]
+        assert server.get_settings().user == payload["user"]
+        assert server.get_settings().password == payload["password"]
+        assert server.get_settings().database == payload["database"]
         assert calls["reset"] == 1
     finally:
-        server.settings.reload_from_environment()
+        server.get_settings().reload_from_environment()
 
     assert captured["host"] == "0.0.0.0"
     assert captured["port"] == 8000
@@ -218,13 +251,13 @@ def test_main_loads_database_override_from_file(tmp_path, monkeypatch: pytest.Mo
 
     try:
         server.main(["--database-payload", f"@{payload_path}"])
-        assert server.settings.host == payload["host"]
-        assert server.settings.port == payload["port"]
-        assert server.settings.user == payload["user"]
-        assert server.settings.password == payload["password"]
-        assert server.settings.database == payload["database"]
+        assert server.get_settings().host == payload["host"]
+        assert server.get_settings().port == payload["port"]
+        assert server.get_settings().user == payload["user"]
+        assert server.get_settings().password == payload["password"]
+        assert server.get_settings().database == payload["database"]
     finally:
-        server.settings.reload_from_environment()
+        server.get_settings().reload_from_environment()
 
     assert captured["host"] == "0.0.0.0"
     assert captured["port"] == 8000
@@ -61,7 +61,7 @@ def test_run_sql_injects_limit(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
     cursor = _setup(monkeypatch, tmp_path, rows=[("a", 1)])
     (tmp_path / "limit_check.sql").write_text("SELECT :limit AS v", encoding="utf-8")
 
-    monkeypatch.setattr(sqlman.settings, "max_rows", 10)
+    monkeypatch.setattr(sqlman.get_settings(), "max_rows", 10)
 
     rows, provenance = sqlman.run_sql("limit_check.sql", {"schema": "public"}, limit=99)
 
@@ -74,14 +74,14 @@ def test_run_sql_injects_limit(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
 def test_run_sql_schema_allowlist(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
     _setup(monkeypatch, tmp_path, rows=[])
     (tmp_path / "bad.sql").write_text("SELECT * FROM secret.table", encoding="utf-8")
-    monkeypatch.setattr(sqlman.settings, "allowed_schemas", ["public"])
+    monkeypatch.setattr(sqlman.get_settings(), "allowed_schemas", ["public"])
 
     with pytest.raises(PermissionError):
         sqlman.run_sql("bad.sql", {"schema": "public"})
 
 
 def test_ensure_schema_allowed_validates_identifiers(monkeypatch: pytest.MonkeyPatch):
-    monkeypatch.setattr(sqlman.settings, "allowed_schemas", ["public"], raising=False)
+    monkeypatch.setattr(sqlman.get_settings(), "allowed_schemas", ["public"], raising=False)
 
     with pytest.raises(ValueError):
         sqlman.ensure_schema_allowed("bad-schema")
@@ -94,8 +94,8 @@ def test_run_sql_uses_configured_timeout(monkeypatch: pytest.MonkeyPatch, tmp_pa
     cursor = _setup(monkeypatch, tmp_path, rows=[("a", 1)])
     (tmp_path / "timeout.sql").write_text("SELECT 1", encoding="utf-8")
 
-    monkeypatch.setattr(sqlman.settings, "max_rows", 5, raising=False)
-    monkeypatch.setattr(sqlman.settings, "query_timeout_s", 42, raising=False)
+    monkeypatch.setattr(sqlman.get_settings(), "max_rows", 5, raising=False)
+    monkeypatch.setattr(sqlman.get_settings(), "query_timeout_s", 42, raising=False)
 
     events: list = []
 
@@ -88,3 +88,11 @@ def test_execute_query_requires_templated_tool():
     )
 
     assert "templated" in result["error"]
+
+
+def test_limit_is_bounded_by_current_max_rows(monkeypatch):
+    monkeypatch.setattr(tools.get_settings(), "max_rows", 10)
+
+    assert tools.SchemaSearch(field_schema="public", term="foo", limit=10).limit == 10
+    with pytest.raises(ValueError, match="at most 10"):
+        tools.SchemaSearch(field_schema="public", term="foo", limit=11)
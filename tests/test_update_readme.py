@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import importlib.util
+import json
+import sys
 import textwrap
 from pathlib import Path
 
@@ -10,6 +12,9 @@ import pytest
 def _load_update_readme() -> object:
     repo_root = Path(__file__).resolve().parents[1]
     module_path = repo_root / "infra" / "update_readme.py"
+    # The infra scripts import their siblings the way they do when run by path.
+    if str(module_path.parent) not in sys.path:
+        sys.path.insert(0, str(module_path.parent))
     spec = importlib.util.spec_from_file_location("update_readme", module_path)
     if spec is None or spec.loader is None:
         raise RuntimeError("Failed to load update_readme module")
@@ -77,3 +82,36 @@ def test_replace_section_inserts_generated_block(temp_readme: Path) -> None:
     assert changed is True
     updated = temp_readme.read_text(encoding="utf-8")
     assert "Not available" in updated
+
+
+def test_replace_section_reports_unchanged_block(temp_readme: Path) -> None:
+    assert update_readme.replace_section(temp_readme, "fixed section") is True
+    before = temp_readme.read_bytes()
+
+    assert update_readme.replace_section(temp_readme, "fixed section") is False
+    assert temp_readme.read_bytes() == before
+    assert before.count(b"fixed section") == 1
+
+
+def test_load_values_from_outputs_uses_top_level_fallbacks(tmp_path: Path) -> None:
+    outputs = tmp_path / "outputs.json"
+    outputs.write_text(
+        json.dumps(
+            {
+                "mcp_endpoints": {
+                    "value": {"direct": {"base_url": " http://direct/ "}, "cloudfront": {}}
+                },
+                "mcp_endpoint": {"value": "http://ignored/"},
+                "mcp_health": {"value": "http://direct/healthz"},
+                "cloudfront_domain": {"value": "d123.cloudfront.net"},
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    values = update_readme.load_values_from_outputs(outputs)
+
+    assert values["http_url"] == "http://direct/"
+    assert values["health_url"] == "http://direct/healthz"
+    assert values["cloudfront_domain"] == "d123.cloudfront.net"
+    assert values["https_url"] is None
@@ -0,0 +1,302 @@
+import importlib.util
+import random
+from pathlib import Path
+import sys
+
+import pytest
+
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "infra" / "validate_network.py"
+SPEC = importlib.util.spec_from_file_location("validate_network", MODULE_PATH)
+assert SPEC and SPEC.loader  # pragma: no cover - guard for missing module
+validate_network = importlib.util.module_from_spec(SPEC)
+sys.modules[SPEC.name] = validate_network
+SPEC.loader.exec_module(validate_network)
+
+
+# Linear scans the security group index replaced, kept as the reference the
+# indexed lookups must agree with.
+def _legacy_allows_port(permissions, port, cidr):
+    for permission in permissions:
+        protocol = permission.get("IpProtocol")
+        ip_ranges = permission.get("IpRanges", [])
+        if not any(r.get("CidrIp") == cidr for r in ip_ranges):
+            continue
+
+        if protocol == "-1":
+            return True
+        if protocol != "tcp":
+            continue
+
+        from_port = permission.get("FromPort")
+        to_port = permission.get("ToPort")
+        if from_port is None or to_port is None:
+            continue
+        if from_port <= port <= to_port:
+            return True
+    return False
+
+
+def _legacy_allows_range(permissions, start_port, end_port, cidr):
+    for permission in permissions:
+        protocol = permission.get("IpProtocol")
+        ip_ranges = permission.get("IpRanges", [])
+        if not any(r.get("CidrIp") == cidr for r in ip_ranges):
+            continue
+
+        if protocol == "-1":
+            return True
+        if protocol != "tcp":
+            continue
+
+        from_port = permission.get("FromPort")
+        to_port = permission.get("ToPort")
+        if from_port is None or to_port is None:
+            continue
+        if from_port <= start_port and to_port >= end_port:
+            return True
+    return False
+
+
+_CIDRS = ("0.0.0.0/0", "10.0.0.0/8", "192.168.1.0/24")
+
+
+def _tcp(from_port, to_port, *cidrs):
+    return {
+        "IpProtocol": "tcp",
+        "FromPort": from_port,
+        "ToPort": to_port,
+        "IpRanges": [{"CidrIp": cidr} for cidr in cidrs],
+    }
+
+
+def _random_permission(rng):
+    protocol = rng.choice(("tcp", "tcp", "tcp", "-1", "udp", "icmp"))
+    permission = {
+        "IpProtocol": protocol,
+        "IpRanges": [{"CidrIp": cidr} for cidr in rng.sample(_CIDRS, rng.randint(0, 2))],
+    }
+    if rng.random() < 0.1:
+        permission["IpRanges"].append({"Description": "no cidr"})
+    if protocol in ("tcp", "udp"):
+        start = rng.randint(0, 60)
+        end = rng.randint(start, 70)
+        if rng.random() > 0.05:
+            permission["FromPort"] = start
+        if rng.random() > 0.05:
+            permission["ToPort"] = end
+    return permission
+
+
+def test_all_traffic_rule_allows_any_port_and_range():
+    index = validate_network.index_permissions(
+        [{"IpProtocol": "-1", "IpRanges": [{"CidrIp": "0.0.0.0/0"}]}]
+    )
+
+    assert validate_network.security_group_allows_port(index, 8000, "0.0.0.0/0")
+    assert validate_network.security_group_allows_range(index, 1024, 65535, "0.0.0.0/0")
+    assert not validate_network.security_group_allows_port(index, 8000, "10.0.0.0/8")
+
+
+def test_overlapping_and_nested_spans_combine_per_rule():
+    index = validate_network.index_permissions(
+        [
+            _tcp(100, 500, "0.0.0.0/0"),
+            _tcp(150, 200, "0.0.0.0/0"),
+            _tcp(400, 900, "0.0.0.0/0"),
+        ]
+    )
+
+    assert validate_network.security_group_allows_range(index, 160, 480, "0.0.0.0/0")
+    assert validate_network.security_group_allows_range(index, 450, 900, "0.0.0.0/0")
+    # No single rule spans 300-600, even though two rules cover it together.
+    assert not validate_network.security_group_allows_range(index, 300, 600, "0.0.0.0/0")
+    assert validate_network.security_group_allows_port(index, 900, "0.0.0.0/0")
+    assert not validate_network.security_group_allows_port(index, 99, "0.0.0.0/0")
+    assert not validate_network.security_group_allows_port(index, 901, "0.0.0.0/0")
+
+
+def test_cidr_misses_and_non_tcp_rules_are_ignored():
+    index = validate_network.index_permissions(
+        [
+            _tcp(8000, 8000, "10.0.0.0/8"),
+            {"IpProtocol": "udp", "FromPort": 0, "ToPort": 65535, "IpRanges": [{"CidrIp": "0.0.0.0/0"}]},
+            {"IpProtocol": "tcp", "FromPort": 0, "IpRanges": [{"CidrIp": "0.0.0.0/0"}]},
+        ]
+    )
+
+    assert validate_network.security_group_allows_port(index, 8000, "10.0.0.0/8")
+    assert not validate_network.security_group_allows_port(index, 8000, "0.0.0.0/0")
+    assert not validate_network.security_group_allows_port(index, 8000, "192.168.1.0/24")
+
+
+def test_security_group_index_matches_linear_scan():
+    rng = random.Random(20240601)
+    for _ in range(2000):
+        permissions = [_random_permission(rng) for _ in range(rng.randint(0, 6))]
+        index = validate_network.index_permissions(permissions)
+        for _ in range(10):
+            cidr = rng.choice(_CIDRS)
+            port = rng.randint(0, 75)
+            start = rng.randint(0, 75)
+            end = rng.randint(start, 75)
+
+            assert validate_network.security_group_allows_port(
+                index, port, cidr
+            ) == _legacy_allows_port(permissions, port, cidr)
+            assert validate_network.security_group_allows_range(
+                index, start, end, cidr
+            ) == _legacy_allows_range(permissions, start, end, cidr)
+
+
+def _legacy_nacl_allows_port(entries, port, cidr, egress):
+    relevant = sorted(
+        (entry for entry in entries if entry.get("Egress") is bool(egress)),
+        key=lambda entry: entry.get("RuleNumber", 0),
+    )
+    for entry in relevant:
+        if not validate_network.nacl_entry_matches(entry, port, cidr):
+            continue
+        return entry.get("RuleAction", "").lower() == "allow"
+    return False
+
+
+def _nacl_entry(rule, action, egress, **extra):
+    entry = {
+        "RuleNumber": rule,
+        "RuleAction": action,
+        "Protocol": "6",
+        "CidrBlock": "0.0.0.0/0",
+        "Egress": egress,
+    }
+    entry.update(extra)
+    return entry
+
+
+def test_sort_nacl_entries_splits_by_direction_and_orders_by_rule():
+    entries = [
+        _nacl_entry(200, "allow", False),
+        _nacl_entry(100, "deny", True),
+        _nacl_entry(50, "allow", False),
+        _nacl_entry(10, "allow", True),
+        {"RuleAction": "allow", "Egress": False},
+    ]
+
+    ingress, egress = validate_network.sort_nacl_entries(entries)
+
+    assert [entry.get("RuleNumber") for entry in ingress] == [None, 50, 200]
+    assert [entry["RuleNumber"] for entry in egress] == [10, 100]
+
+
+@pytest.mark.parametrize("egress", [None, "true", "false", 1, 0])
+def test_sort_nacl_entries_excludes_missing_or_non_bool_egress(egress):
+    entry = _nacl_entry(100, "allow", egress)
+    if egress is None:
+        del entry["Egress"]
+
+    assert validate_network.sort_nacl_entries([entry]) == ([], [])
+
+
+def test_nacl_allows_port_uses_first_matching_rule():
+    ingress, _ = validate_network.sort_nacl_entries(
+        [
+            _nacl_entry(200, "allow", False, PortRange={"From": 0, "To": 65535}),
+            _nacl_entry(100, "deny", False, PortRange={"From": 8000, "To": 8000}),
+        ]
+    )
+
+    assert not validate_network.nacl_allows_port(ingress, 8000, "0.0.0.0/0")
+    assert validate_network.nacl_allows_port(ingress, 8001, "0.0.0.0/0")
+    assert not validate_network.nacl_allows_port(ingress, 8001, "10.0.0.0/8")
+
+
+def test_sorted_nacl_lookup_matches_per_call_sort():
+    rng = random.Random(20240602)
+    for _ in range(2000):
+        entries = []
+        for _ in range(rng.randint(0, 6)):
+            entry = {
+                "RuleNumber": rng.randint(1, 10),
+                "RuleAction": rng.choice(("allow", "deny", "ALLOW")),
+                "Protocol": rng.choice(("6", "-1", "17")),
+                "CidrBlock": rng.choice(_CIDRS),
+                "Egress": rng.choice((True, False, None, "true")),
+            }
+            if rng.random() < 0.2:
+                del entry["RuleNumber"]
+            if rng.random() < 0.7:
+                start = rng.randint(0, 60)
+                entry["PortRange"] = {"From": start, "To": rng.randint(start, 70)}
+            entries.append(entry)
+
+        ingress, egress = validate_network.sort_nacl_entries(entries)
+        for _ in range(10):
+            cidr = rng.choice(_CIDRS)
+            port = rng.randint(0, 75)
+
+            assert validate_network.nacl_allows_port(
+                ingress, port, cidr
+            ) == _legacy_nacl_allows_port(entries, port, cidr, egress=False)
+            assert validate_network.nacl_allows_port(
+                egress, port, cidr
+            ) == _legacy_nacl_allows_port(entries, port, cidr, egress=True)
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--instance-id", "i-123"],
+        ["--instance-id=i-123"],
+        ["--instance-id="],
+        ["--instance-id", "i-123", "--port", "9000"],
+        ["--port=9000", "--instance-id=i-123", "--cidr=10.0.0.0/8"],
+        [
+            "--instance-id",
+            "i-123",
+            "--return-port-start",
+            "2000",
+            "--return-port-end=3000",
+            "--cidr",
+            "192.168.1.0/24",
+        ],
+        ["--instance-id", "a", "--instance-id", "b"],
+    ],
+)
+def test_parse_fast_matches_argparse_on_accepted_forms(argv):
+    fast = validate_network._parse_fast(argv)
+
+    assert fast is not None
+    assert vars(fast) == vars(validate_network._build_parser().parse_args(argv))
+    assert vars(validate_network.parse_args(argv)) == vars(fast)
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        [],
+        ["--help"],
+        ["-h"],
+        ["--port", "9000"],
+        ["--instance-id"],
+        ["--instance-id", "i-123", "--port"],
+        ["--instance-id", "--port", "9000"],
+        ["--instance-id", "i-123", "--port", "-1"],
+        ["--instance-id", "i-123", "--port", "abc"],
+        ["--instance-id", "i-123", "--port="],
+        ["--inst", "i-123"],
+        ["--instance-id", "i-123", "extra"],
+        ["--instance-id", "i-123", "--unknown", "x"],
+    ],
+)
+def test_parse_fast_declines_unusual_command_lines(argv):
+    assert validate_network._parse_fast(argv) is None
+
+
+def test_parse_args_defers_declined_forms_to_argparse():
+    args = validate_network.parse_args(["--inst", "i-123", "--port", "9000"])
+
+    assert args.instance_id == "i-123"
+    assert args.port == 9000
+
+    with pytest.raises(SystemExit):
+        validate_network.parse_args(["--instance-id", "i-123", "--port", "abc"])